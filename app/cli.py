@@ -11,6 +11,7 @@ import sys
 from typing import List
 
 from .services.scheduler_service import SchedulerService
+from .scrapers.daywork123 import browser_pool
 from .config import SchedulerConfig
 
 
@@ -244,19 +245,21 @@ async def cmd_list_jobs(args):
         if args.json:
             print(json.dumps(jobs, indent=2, default=str))
         else:
-            print("=== Scheduled Jobs ===")
+            # Build the listing and write it with one print
+            lines = ["=== Scheduled Jobs ==="]
             if not jobs:
-                print("No jobs scheduled")
+                lines.append("No jobs scheduled")
             else:
                 for job in jobs:
-                    print(f"ID: {job.get('id')}")
-                    print(f"  Name: {job.get('name')}")
-                    print(f"  Next Run: {job.get('next_run_time')}")
-                    print(f"  Trigger: {job.get('trigger')}")
+                    lines.append(f"ID: {job.get('id')}")
+                    lines.append(f"  Name: {job.get('name')}")
+                    lines.append(f"  Next Run: {job.get('next_run_time')}")
+                    lines.append(f"  Trigger: {job.get('trigger')}")
                     kwargs = job.get('kwargs', {})
                     if kwargs:
-                        print(f"  Period: {kwargs.get('period', 'unknown')}")
-                    print()
+                        lines.append(f"  Period: {kwargs.get('period', 'unknown')}")
+                    lines.append("")
+            print("\n".join(lines))
                     
     except Exception as e:
         error_msg = {"error": str(e)}
@@ -277,12 +280,15 @@ async def cmd_next_runs(args):
         if args.json:
             print(json.dumps(next_runs, indent=2, default=str))
         else:
-            print(f"=== Next {args.limit} Scheduled Runs ===")
+            lines = [f"=== Next {args.limit} Scheduled Runs ==="]
             if not next_runs:
-                print("No upcoming runs scheduled")
+                lines.append("No upcoming runs scheduled")
             else:
-                for run in next_runs:
-                    print(f"{run.get('next_run_time')} - {run.get('job_name')} ({run.get('period')})")
+                lines.extend(
+                    f"{run.get('next_run_time')} - {run.get('job_name')} ({run.get('period')})"
+                    for run in next_runs
+                )
+            print("\n".join(lines))
                     
     except Exception as e:
         error_msg = {"error": str(e)}
@@ -399,19 +405,28 @@ async def main():
         parser.print_help()
         sys.exit(1)
     
-    try:
-        await args.func(args)
-    except KeyboardInterrupt:
-        print("\nOperation cancelled by user")
-        sys.exit(1)
-    except Exception as e:
-        error_msg = {"error": str(e)}
-        if args.json:
-            print(json.dumps(error_msg, indent=2))
-        else:
-            print(f"Unexpected error: {e}")
-        sys.exit(1)
+    # Share one Chromium across the command's Daywork123 scrapes; shut it down on the way out
+    async with browser_pool:
+        try:
+            await args.func(args)
+        except KeyboardInterrupt:
+            print("\nOperation cancelled by user")
+            sys.exit(1)
+        except Exception as e:
+            error_msg = {"error": str(e)}
+            if args.json:
+                print(json.dumps(error_msg, indent=2))
+            else:
+                print(f"Unexpected error: {e}")
+            sys.exit(1)
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    # uvloop (shipped with uvicorn[standard]) has a faster event loop; fall back to asyncio's
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
@@ -1,7 +1,12 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, func, text
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import DateTime
 from sqlalchemy.orm import sessionmaker
 import os
+import threading
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,8 +14,54 @@ load_dotenv()
 # Database URL from environment or default to SQLite
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./yacht_jobs.db")
 
+def _json_serializer(value) -> str:
+    """Serialize JSON columns with orjson (also handles datetimes natively)"""
+    return orjson.dumps(value).decode()
+
 # Create engine
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {})
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads
+)
+
+# Per-connection SQLite tuning: WAL lets readers run during scraper writes,
+# NORMAL sync is safe under WAL, and a 64MB page cache keeps hot pages in memory.
+# Connections are pooled by the engine, so this runs once per pooled connection.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply SQLITE_PRAGMAS to each new SQLite connection"""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database
+    
+    Timestamp columns are naive and compared against datetime.utcnow(), so the
+    database has to produce UTC regardless of the server's session time zone.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -18,10 +69,49 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for models
 Base = declarative_base()
 
+# Set once the schema has been checked/created in this process; the lock keeps concurrent
+# first callers (e.g. savers in worker threads) from issuing the same CREATE TABLEs twice
+_DB_READY = False
+_DB_INIT_LOCK = threading.Lock()
+
+def init_db():
+    """Create missing tables, once per process
+    
+    Existing tables are left as they are; run migrate_database.py to bring an
+    older schema up to date.
+    """
+    global _DB_READY
+    if _DB_READY:
+        return
+    with _DB_INIT_LOCK:
+        if _DB_READY:
+            return
+        from . import models  # noqa: F401 - registers the tables on Base.metadata
+        Base.metadata.create_all(bind=engine)
+        _DB_READY = True
+
 def get_db():
     """Database dependency for FastAPI"""
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+def approx_count(db, model) -> tuple[int, bool]:
+    """Cheap row count for informational logging.
+    
+    On PostgreSQL this reads the planner estimate from pg_class.reltuples instead
+    of scanning the table. Other backends, and tables whose estimate is still 0
+    or -1 because they have never been vacuumed or analyzed, fall back to an
+    exact COUNT(*). Returns (count, is_estimate). Don't use it where totals are
+    shown next to exact counts or drive pagination.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        estimate = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {"table": model.__tablename__}
+        ).scalar()
+        if estimate is not None and estimate > 0:
+            return estimate, True
+    return db.query(func.count()).select_from(model).scalar(), False
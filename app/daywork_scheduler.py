@@ -17,11 +17,12 @@ from apscheduler.triggers.cron import CronTrigger
 
 from .config import SchedulerConfig
 from .scrapers.registry import ScraperRegistry
-from .database import SessionLocal
+from .database import SessionLocal, init_db
 from .models import ScrapingJob
 
 
-async def run_daywork123_scraping_job(period: str, hour: int, minute: int, max_pages: int = 5):
+async def run_daywork123_scraping_job(period: str, hour: Optional[int] = None,
+                                      minute: Optional[int] = None, max_pages: int = 5):
     """
     Standalone function to execute the Daywork123 scraping task.
     
@@ -29,11 +30,15 @@ async def run_daywork123_scraping_job(period: str, hour: int, minute: int, max_p
     
     Args:
         period: Time period ('morning', 'day', 'evening')
-        hour: Hour when the job was scheduled
-        minute: Minute when the job was scheduled
+        hour: Hour when the job was scheduled (defaults to the current UTC hour)
+        minute: Minute when the job was scheduled (defaults to the current UTC minute)
         max_pages: Maximum pages to scrape
     """
     start_time = datetime.now()
+    # One cron job covers every slot of a period, so the slot is read off the clock
+    if hour is None or minute is None:
+        now_utc = datetime.utcnow()
+        hour, minute = now_utc.hour, now_utc.minute
     db = SessionLocal()
     scraping_job = None
     
@@ -169,6 +174,9 @@ class ScrapingScheduler:
             if not self.config.validate_config():
                 raise ValueError("Invalid scheduler configuration")
             
+            # Scheduled runs record ScrapingJob rows before any jobs are upserted; create the tables first
+            init_db()
+            
             # Start the scheduler
             self.scheduler.start()
             logger.info("Scheduler started successfully")
@@ -196,7 +204,8 @@ class ScrapingScheduler:
         """
         Schedule Daywork123 scraper jobs with time-based intervals.
         
-        Creates three separate cron jobs:
+        Creates three cron jobs (daywork123_morning/day/evening), each firing at
+        every hour/minute combination configured for its period:
         - Morning: High frequency during morning hours
         - Day: Lower frequency during daytime hours
         - Evening: High frequency during evening hours
@@ -205,62 +214,30 @@ class ScrapingScheduler:
             # Remove existing Daywork123 jobs
             await self.remove_daywork123_jobs()
             
-            # Schedule morning jobs
-            for hour in self.config.MORNING_HOURS:
-                for minute in self.config.MORNING_MINUTES:
-                    job_id = f'daywork123_morning_{hour:02d}_{minute:02d}'
-                    self.scheduler.add_job(
-                        func=run_daywork123_scraping_job,
-                        trigger=CronTrigger(hour=hour, minute=minute),
-                        id=job_id,
-                        name=f'Daywork123 Morning Scraping ({hour:02d}:{minute:02d})',
-                        kwargs={
-                            'period': 'morning', 
-                            'hour': hour, 
-                            'minute': minute,
-                            'max_pages': self.config.DAYWORK123_MAX_PAGES
-                        },
-                        replace_existing=True
-                    )
-            
-            # Schedule day jobs
-            for hour in self.config.DAY_HOURS:
-                for minute in self.config.DAY_MINUTES:
-                    job_id = f'daywork123_day_{hour:02d}_{minute:02d}'
-                    self.scheduler.add_job(
-                        func=run_daywork123_scraping_job,
-                        trigger=CronTrigger(hour=hour, minute=minute),
-                        id=job_id,
-                        name=f'Daywork123 Day Scraping ({hour:02d}:{minute:02d})',
-                        kwargs={
-                            'period': 'day', 
-                            'hour': hour, 
-                            'minute': minute,
-                            'max_pages': self.config.DAYWORK123_MAX_PAGES
-                        },
-                        replace_existing=True
-                    )
-            
-            # Schedule evening jobs
-            for hour in self.config.EVENING_HOURS:
-                for minute in self.config.EVENING_MINUTES:
-                    job_id = f'daywork123_evening_{hour:02d}_{minute:02d}'
-                    self.scheduler.add_job(
-                        func=run_daywork123_scraping_job,
-                        trigger=CronTrigger(hour=hour, minute=minute),
-                        id=job_id,
-                        name=f'Daywork123 Evening Scraping ({hour:02d}:{minute:02d})',
-                        kwargs={
-                            'period': 'evening', 
-                            'hour': hour, 
-                            'minute': minute,
-                            'max_pages': self.config.DAYWORK123_MAX_PAGES
-                        },
-                        replace_existing=True
-                    )
+            # One aggregate cron trigger per period instead of one job per (hour, minute) slot
+            periods = (
+                ('morning', self.config.MORNING_HOURS, self.config.MORNING_MINUTES),
+                ('day', self.config.DAY_HOURS, self.config.DAY_MINUTES),
+                ('evening', self.config.EVENING_HOURS, self.config.EVENING_MINUTES),
+            )
+            for period, hours, minutes in periods:
+                self.scheduler.add_job(
+                    func=run_daywork123_scraping_job,
+                    trigger=CronTrigger(
+                        hour=','.join(map(str, hours)),
+                        minute=','.join(map(str, minutes))
+                    ),
+                    id=f'daywork123_{period}',
+                    name=f'Daywork123 {period.capitalize()} Scraping',
+                    kwargs={
+                        'period': period,
+                        'max_pages': self.config.DAYWORK123_MAX_PAGES
+                    },
+                    replace_existing=True
+                )
             
-            total_jobs = self.config.get_total_daily_runs()
-            logger.info(f"Scheduled {total_jobs} Daywork123 scraping jobs per day")
+            total_runs = self.config.get_total_daily_runs()
+            logger.info(f"Scheduled {len(periods)} Daywork123 jobs ({total_runs} runs per day)")
             
         except Exception as e:
             logger.error(f"Error scheduling Daywork123 scraper: {e}")
@@ -329,6 +306,40 @@ class ScrapingScheduler:
         except Exception as e:
             logger.error(f"Error getting jobs status: {e}")
         return jobs_status
+    
+    def get_upcoming_runs(self, limit: int = 10) -> List[Dict]:
+        """
+        Get the next fire times of all Daywork123 jobs, soonest first.
+        
+        Each job covers a whole period's cron slots, so its trigger is stepped
+        forward to list up to limit runs per job before merging.
+        
+        Args:
+            limit: Maximum number of runs to return
+            
+        Returns:
+            List of dictionaries with job and run time information
+        """
+        runs = []
+        try:
+            for job in self.scheduler.get_jobs():
+                if not job.id.startswith('daywork123_'):
+                    continue
+                fire_time = job.next_run_time  # None while the job is paused
+                for _ in range(limit):
+                    if fire_time is None:
+                        break
+                    runs.append({
+                        'job_id': job.id,
+                        'job_name': job.name,
+                        'next_run_time': fire_time,
+                        'period': job.kwargs.get('period', 'unknown')
+                    })
+                    fire_time = job.trigger.get_next_fire_time(fire_time, fire_time)
+        except Exception as e:
+            logger.error(f"Error getting upcoming runs: {e}")
+        runs.sort(key=lambda run: run['next_run_time'])
+        return runs[:limit]
         
     def pause_job(self, job_id: str) -> bool:
         """
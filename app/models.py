@@ -1,6 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Float, func, JSON
-from datetime import datetime
-from .database import Base
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Float, func, JSON, Index
+from .database import Base, utcnow
 import uuid
 
 class Job(Base):
@@ -45,13 +44,17 @@ class Job(Base):
     
     # Metadata
     source_url = Column(String)
-    source = Column(String, default="yotspot")
+    source = Column(String, default="yotspot", index=True)
     is_featured = Column(Boolean, default=False)
     quality_score = Column(Float, default=0.0)
     raw_data = Column(JSON)  # Store raw scraping data
-    scraped_at = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    content_hash = Column(String(16))  # Digest of scraped fields; unchanged rows skip upserts
+    # Filled by the database (once per statement) rather than per row in Python; default= puts
+    # the timestamp in the INSERT itself, so tables created before the server defaults still get
+    # a value. utcnow() keeps them in UTC whatever the database session's time zone is
+    scraped_at = Column(DateTime, default=utcnow(), server_default=utcnow())
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow())
+    updated_at = Column(DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
@@ -84,10 +87,13 @@ class Job(Base):
             "is_featured": self.is_featured,
             "quality_score": self.quality_score,
             "scraped_at": self.scraped_at.isoformat() if self.scraped_at else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
 
+# Newest-first listings and created_at range counts walk this index instead of sorting
+Index("ix_jobs_created_at_desc", Job.created_at.desc())
+
 class ScrapingJob(Base):
     __tablename__ = "scraping_jobs"
     
@@ -1,9 +1,11 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+import asyncio
 import logging
 from datetime import datetime
 from .database import SessionLocal
-from .models import Job, ScrapingJob
+from .models import ScrapingJob
+from .scrapers.base import JobBatcher
 from .scrapers.yotspot import YotspotScraper
 
 logger = logging.getLogger(__name__)
@@ -11,6 +13,31 @@ logger = logging.getLogger(__name__)
 scheduler = BackgroundScheduler()
 scraper = YotspotScraper()
 
+async def _scrape_and_save(max_pages: int):
+    """Scrape Yotspot and upsert jobs batch by batch as they arrive
+    
+    Returns:
+        Tuple of (jobs found, new jobs)
+    """
+    jobs_found = 0
+    
+    async def save(batch) -> int:
+        new_jobs, _ = await scraper.upsert_jobs(batch)
+        return new_jobs
+    
+    batcher = JobBatcher(save)
+    try:
+        async for job in scraper.scrape_jobs(max_pages=max_pages):
+            jobs_found += 1
+            await batcher.add(job)
+    except Exception as e:
+        logger.error(f"Error in scheduled scraping: {e}")
+    finally:
+        # Each run gets a fresh event loop, so the scraper's HTTP session can't outlive it
+        await scraper.close()
+    
+    return jobs_found, await batcher.flush()
+
 def scheduled_scrape_job():
     """Scheduled function to scrape jobs"""
     db = SessionLocal()
@@ -26,45 +53,18 @@ def scheduled_scrape_job():
         db.add(scraping_job)
         db.commit()
         
-        # Run scraper
-        jobs_found = []
-        try:
-            # Note: We need to make this async-compatible or run in sync mode
-            import asyncio
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            jobs_found = loop.run_until_complete(scraper.scrape_jobs(max_pages=3))
-        except Exception as e:
-            logger.error(f"Error in scheduled scraping: {e}")
-            jobs_found = []
-        
-        # Save jobs to database
-        new_jobs = 0
-        for job_data in jobs_found:
-            try:
-                existing_job = db.query(Job).filter(Job.external_id == job_data["external_id"]).first()
-                if not existing_job:
-                    job = Job(**job_data)
-                    db.add(job)
-                    new_jobs += 1
-            except Exception as e:
-                logger.error(f"Error saving job: {e}")
-                continue
-        
-        db.commit()
+        # Run scraper; APScheduler calls this in a worker thread, so one asyncio.run owns
+        # the whole scrape and new jobs are written in batches while it runs
+        jobs_found, new_jobs = asyncio.run(_scrape_and_save(max_pages=3))
         
         # Update scraping job
         scraping_job.status = "completed"
         scraping_job.completed_at = datetime.now()
-        scraping_job.jobs_found = len(jobs_found)
+        scraping_job.jobs_found = jobs_found
         scraping_job.new_jobs = new_jobs
         db.commit()
         
-        logger.info(f"Scheduled scraping completed. Found {len(jobs_found)} jobs, {new_jobs} new")
+        logger.info(f"Scheduled scraping completed. Found {jobs_found} jobs, {new_jobs} new")
         
     except Exception as e:
         logger.error(f"Error in scheduled scrape: {e}")
@@ -76,8 +76,8 @@ def scheduled_scrape_job():
                 scraping_job.completed_at = datetime.now()
                 scraping_job.error_message = str(e)
                 db.commit()
-        except:
-            pass
+        except Exception as db_error:
+            logger.error(f"Error recording failed scheduled scrape: {db_error}")
     finally:
         db.close()
 
@@ -1,9 +1,52 @@
 """Base scraper interface for pluggable architecture"""
+import asyncio
+import csv
+import io
+import logging
+import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, AsyncIterator, Optional
+from itertools import islice
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field, HttpUrl
 from enum import Enum
+import hashlib
+import orjson
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal, init_db, utcnow
+from ..models import Job
+
+logger = logging.getLogger(__name__)
+
+# Rows per executemany call of the upsert statement, to bound per-call memory
+UPSERT_CHUNK_SIZE = 1000
+
+# Columns refreshed when a scraped job already exists (creation/scrape metadata is kept)
+UPSERT_UPDATE_COLUMNS = (
+    'title', 'company', 'location', 'country', 'region', 'description',
+    'salary_range', 'salary_currency', 'salary_period', 'employment_type',
+    'job_type', 'department', 'vessel_type', 'vessel_size', 'vessel_name',
+    'position_level', 'start_date', 'requirements', 'benefits', 'posted_date',
+    'quality_score', 'raw_data', 'content_hash',
+)
+
+# Batches at least this large are upserted on PostgreSQL (psycopg2) via COPY into a staging table
+COPY_UPSERT_THRESHOLD = 500
+JSON_COLUMNS = frozenset({'requirements', 'benefits', 'raw_data'})
+
+# Raw job keys already persisted as Job columns; left out of raw_data unless the column
+# holds a different (e.g. truncated) value
+RAW_KEYS_STORED_AS_COLUMNS = frozenset({
+    'external_id', 'title', 'company', 'location', 'url', 'salary',
+    'description', 'full_description', 'requirements', 'benefits', 'posted_date',
+})
+
+# JobBatcher defaults: flush after this many jobs, or once the oldest buffered job is this old (s)
+JOB_BATCH_SIZE = 500
+JOB_BATCH_MAX_AGE = 2.0
 
 class JobSource(str, Enum):
     """Supported job sources"""
@@ -38,6 +81,58 @@ class VesselType(str, Enum):
     EXPEDITION = "expedition"
     CHASE_BOAT = "chase_boat"
 
+# Enum member -> its value string. str-enum members hash/compare equal to their values, so a
+# lookup also maps plain strings (UniversalJob stores enum values) onto the shared value objects.
+_ENUM_TO_STR = {
+    member: member.value
+    for enum_cls in (JobSource, EmploymentType, Department, VesselType)
+    for member in enum_cls
+}
+
+def _batched(items, size: int):
+    """Yield successive lists of at most size items (itertools.batched backport)"""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+# Upsert statement per dialect name, built once and reused so SQLAlchemy's compiled cache hits
+_UPSERT_STATEMENTS: Dict[str, Any] = {}
+
+def _upsert_statement(db: Session):
+    """Return the cached INSERT ... ON CONFLICT (external_id) DO UPDATE for db's dialect
+    
+    It returns (external_id, scraped_at) for each row actually inserted or updated;
+    rows skipped by the content_hash guard return nothing. Updates keep the stored
+    scraped_at, so it only matches the job's own value when the row was inserted.
+    Only PostgreSQL and SQLite are supported; other dialects raise ValueError.
+    """
+    dialect_name = db.get_bind().dialect.name
+    stmt = _UPSERT_STATEMENTS.get(dialect_name)
+    if stmt is None:
+        if dialect_name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect_name == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            raise ValueError(f"unsupported dialect: {dialect_name}")
+        stmt = insert(Job)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['external_id'],
+            set_={
+                **{col: stmt.excluded[col] for col in UPSERT_UPDATE_COLUMNS},
+                'updated_at': utcnow()
+            },
+            where=Job.content_hash.is_distinct_from(stmt.excluded.content_hash)
+        ).returning(Job.external_id, Job.scraped_at)
+        _UPSERT_STATEMENTS[dialect_name] = stmt
+    return stmt
+
+def _content_hash(content: Dict[str, Any]) -> str:
+    """Stable 64-bit hex digest of a row's scraped content"""
+    return hashlib.blake2b(
+        orjson.dumps(content, option=orjson.OPT_SORT_KEYS), digest_size=8
+    ).hexdigest()
+
 class UniversalJob(BaseModel):
     """Standardized job format across all sources"""
     
@@ -84,6 +179,91 @@ class UniversalJob(BaseModel):
     
     class Config:
         use_enum_values = True
+    
+    def to_row_dict(self) -> Dict[str, Any]:
+        """Map this job onto Job column values for bulk inserts/upserts"""
+        to_str = _ENUM_TO_STR.get
+        employment_type = to_str(self.employment_type, self.employment_type)
+        row = {
+            "external_id": self.external_id,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "country": self.country,
+            "region": self.region,
+            "description": self.description,
+            "source": to_str(self.source, self.source),
+            "source_url": str(self.source_url),
+            "salary_range": self.salary_range,
+            "salary_currency": self.salary_currency,
+            "salary_period": self.salary_period,
+            "employment_type": employment_type,
+            "job_type": employment_type,  # Keep compatibility
+            "department": to_str(self.department, self.department),
+            "vessel_type": to_str(self.vessel_type, self.vessel_type),
+            "vessel_size": self.vessel_size,
+            "vessel_name": self.vessel_name,
+            "position_level": self.position_level,
+            "start_date": self.start_date,
+            "requirements": self.requirements,
+            "benefits": self.benefits,
+            "posted_date": self.posted_date,
+            "posted_at": self.posted_date,  # Keep compatibility
+            "quality_score": self.quality_score,
+        }
+        # Hash before adding per-scrape metadata, which shouldn't make an unchanged job look new;
+        # serializing the row as-is avoids building a filtered copy per job
+        row["content_hash"] = _content_hash(row)
+        row["raw_data"] = self.raw_data
+        row["scraped_at"] = self.scraped_at
+        return row
+
+def _copy_upsert(db: Session, rows: List[Dict[str, Any]]) -> List[Tuple[str, datetime]]:
+    """Upsert rows on PostgreSQL via COPY into a temp staging table plus one INSERT ... SELECT
+    
+    Same semantics (and RETURNING rows) as _upsert_statement. The caller commits,
+    which drops the staging table.
+    """
+    # COPY bypasses Python-side column defaults: id is generated here, and scalar defaults
+    # (e.g. is_featured=False) for columns the rows don't carry are sent explicitly
+    defaults = {
+        column.name: column.default.arg for column in Job.__table__.columns
+        if column.default is not None and column.default.is_scalar and column.name not in rows[0]
+    }
+    columns = ['id', *rows[0], *defaults]
+    buffer = io.StringIO()
+    # None is written as \N (declared as the NULL marker below) so empty strings stay ''
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([str(uuid.uuid4()), *(
+            '\\N' if value is None
+            else orjson.dumps(value).decode() if key in JSON_COLUMNS
+            else value
+            for key, value in row.items()
+        ), *defaults.values()])
+    buffer.seek(0)
+    
+    column_list = ', '.join(columns)
+    update_list = ', '.join(f"{col} = EXCLUDED.{col}" for col in UPSERT_UPDATE_COLUMNS)
+    db.execute(text(
+        "CREATE TEMP TABLE jobs_stage (LIKE jobs INCLUDING DEFAULTS) ON COMMIT DROP"
+    ))
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY jobs_stage ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer
+        )
+    finally:
+        cursor.close()
+    # Timestamps are set explicitly: older jobs tables have no server-side DEFAULT for them
+    result = db.execute(text(
+        f"INSERT INTO jobs ({column_list}, created_at, updated_at) "
+        f"SELECT {column_list}, timezone('utc', now()), timezone('utc', now()) FROM jobs_stage "
+        f"ON CONFLICT (external_id) DO UPDATE SET {update_list}, updated_at = timezone('utc', now()) "
+        f"WHERE jobs.content_hash IS DISTINCT FROM EXCLUDED.content_hash "
+        f"RETURNING external_id, scraped_at"
+    ))
+    return result.all()
 
 class ScrapingResult(BaseModel):
     """Result from scraping operation"""
@@ -127,11 +307,171 @@ class BaseScraper(ABC):
         """Return list of supported filter parameters"""
         pass
     
+    async def close(self):
+        """Release resources held across calls, e.g. a shared HTTP session"""
+        pass
+    
+    def _compact_raw_data(self, raw_job: Dict[str, Any],
+                          stored: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Keep raw fields that aren't already stored in their own columns
+        
+        A column-backed field is kept too when its stored value (from stored, by raw
+        key) differs from the raw one, e.g. truncated to fit, so the original survives.
+        """
+        stored = stored or {}
+        extra = {
+            k: v for k, v in raw_job.items()
+            if k not in RAW_KEYS_STORED_AS_COLUMNS or (v and stored.get(k, v) != v)
+        }
+        return extra or None
+    
+    def _day_precision_date(self, date_text: str, parse: Callable[[str], Optional[datetime]],
+                            today: datetime) -> Optional[datetime]:
+        """Parse a posted date with parse and truncate it to the day
+        
+        Relative dates ("3 hours ago") would otherwise carry the scrape time and change
+        the job's content_hash on every run. Text the parser chokes on falls back to today.
+        """
+        try:
+            parsed = parse(date_text)
+        except (ImportError, ValueError, OverflowError) as e:
+            logger.debug(f"Could not parse date {date_text!r}: {e}")
+            return today
+        return parsed.replace(hour=0, minute=0, second=0, microsecond=0) if parsed else None
+    
     async def health_check(self) -> Dict[str, Any]:
         """Health check for monitoring"""
+        accessible = await self.test_connection()
         return {
             "source": self.source_name,
-            "accessible": await self.test_connection(),
+            "accessible": accessible,
             "last_scrape": None,
-            "status": "healthy" if await self.test_connection() else "unhealthy"
-        }
\ No newline at end of file
+            "status": "healthy" if accessible else "unhealthy"
+        }
+    
+    async def save_jobs_to_db(self, jobs: List[UniversalJob]) -> int:
+        """Upsert scraped jobs into the jobs table
+        
+        Args:
+            jobs: List of UniversalJob objects to save
+            
+        Returns:
+            Number of jobs inserted or changed (unchanged jobs aren't counted)
+        """
+        inserted, updated = await self.upsert_jobs(jobs)
+        return inserted + updated
+    
+    async def upsert_jobs(self, jobs: List[UniversalJob]) -> Tuple[int, int]:
+        """Upsert scraped jobs into the jobs table
+        
+        Jobs are written with a cached INSERT ... ON CONFLICT (external_id) DO UPDATE
+        executed over chunks of row dicts, so no per-job existence SELECT is needed.
+        Rows whose content_hash is unchanged are left untouched.
+        
+        Args:
+            jobs: List of UniversalJob objects to save
+            
+        Returns:
+            Tuple of (new jobs, updated jobs)
+        """
+        if not jobs:
+            return 0, 0
+        
+        # Later duplicates of the same external_id win; one statement can't touch a row twice
+        rows_by_external_id = {}
+        for job in jobs:
+            try:
+                rows_by_external_id[job.external_id] = job.to_row_dict()
+            except Exception as e:
+                logger.error(f"Error saving job {job.title}: {e}")
+                continue
+        
+        if not rows_by_external_id:
+            return 0, 0
+        
+        # Sync session work runs off the event loop so scraping keeps going during writes
+        return await asyncio.to_thread(self._upsert_rows, list(rows_by_external_id.values()))
+    
+    def _upsert_rows(self, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Upsert row dicts in chunks under one commit; returns (inserted, updated), (0, 0) on error"""
+        with SessionLocal() as db:
+            try:
+                # Scrapers also run outside the web app (CLI, schedulers); make sure the tables
+                # exist. Inside the try so an unreachable database is logged like any other
+                init_db()
+                bind = db.get_bind()
+                if (len(rows) >= COPY_UPSERT_THRESHOLD
+                        and bind.dialect.name == 'postgresql' and bind.dialect.driver == 'psycopg2'):
+                    written = _copy_upsert(db, rows)
+                else:
+                    stmt = _upsert_statement(db)
+                    written = []
+                    for chunk in _batched(rows, UPSERT_CHUNK_SIZE):
+                        written.extend(db.execute(stmt, chunk))
+                db.commit()
+                
+                # A returned scraped_at equal to this scrape's value means the row was inserted
+                scraped_at = {row['external_id']: row['scraped_at'] for row in rows}
+                inserted = sum(1 for external_id, stored in written if stored == scraped_at[external_id])
+                updated = len(written) - inserted
+                logger.info(
+                    f"Saved jobs to database: {inserted} new, {updated} updated, "
+                    f"{len(rows) - inserted - updated} unchanged"
+                )
+            except Exception as e:
+                logger.error(f"Error committing jobs to database: {e}")
+                db.rollback()
+                return 0, 0
+        
+        return inserted, updated
+
+
+class JobBatcher:
+    """Buffers scraped jobs and saves them in batches while scraping continues
+    
+    A batch is handed to the save callable once it reaches max_batch_size jobs or
+    its oldest job has waited max_queue_time seconds (checked as jobs are added).
+    Each save runs as a background task, so the next batch keeps filling while the
+    previous one is written; at most one save is in flight at a time.
+    """
+    
+    def __init__(self,
+                 save: Callable[[List[UniversalJob]], Awaitable[int]],
+                 max_batch_size: int = JOB_BATCH_SIZE,
+                 max_queue_time: float = JOB_BATCH_MAX_AGE):
+        self._save = save
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._batch: List[UniversalJob] = []
+        self._batch_started = 0.0
+        self._pending: Optional[asyncio.Task] = None
+        self.saved = 0
+    
+    async def add(self, job: UniversalJob):
+        """Buffer a job, handing off the batch when it is full or old enough"""
+        if not self._batch:
+            self._batch_started = time.monotonic()
+        self._batch.append(job)
+        
+        if (len(self._batch) >= self.max_batch_size
+                or time.monotonic() - self._batch_started >= self.max_queue_time):
+            await self._submit()
+    
+    async def flush(self) -> int:
+        """Save anything still buffered, wait for in-flight saves and return the total saved"""
+        await self._submit()
+        await self._wait_pending()
+        return self.saved
+    
+    async def _submit(self):
+        """Start saving the current batch once the previous save has finished"""
+        await self._wait_pending()
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._pending = asyncio.create_task(self._save(batch))
+    
+    async def _wait_pending(self):
+        """Wait for the in-flight save, if any, and count what it wrote"""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self.saved += await pending
@@ -1,11 +1,12 @@
 """Daywork123.com scraper with anti-detection measures"""
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional, List, AsyncIterator
-from datetime import datetime
+from datetime import datetime, date, timezone
+from functools import lru_cache
 import re
 from urllib.parse import urljoin, urlparse
-from sqlalchemy.orm import Session
 
 try:
     from playwright.async_api import async_playwright, Browser, Page
@@ -14,13 +15,192 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logging.warning("Playwright not available. Install with: pip install playwright")
 
-from .base import BaseScraper, UniversalJob, JobSource, EmploymentType, Department, VesselType
+from .base import BaseScraper, JobBatcher, UniversalJob, JobSource, EmploymentType, Department, VesselType
 from .registry import register_scraper
-from ..database import SessionLocal
-from ..models import Job
 
 logger = logging.getLogger(__name__)
 
+# Formats used by the Daywork123 listing date column (e.g. "15-Aug-2025"),
+# tried with strptime before falling back to dateparser
+DATE_FORMATS = ('%d-%b-%Y', '%d-%B-%Y')
+_FAST_DATE_RE = re.compile(r'^(\d{4})[-/](\d{1,2})[-/](\d{1,2})$')
+
+# Title/text classifiers, compiled once at import: one alternation per category, checked in
+# order against lowercased text (substring match); the first hit wins
+_EMPLOYMENT_TYPE_PATTERNS = tuple((re.compile('|'.join(map(re.escape, words))), value) for words, value in [
+    (['daywork', 'day work', 'daily'], EmploymentType.DAYWORK),
+    (['rotational', 'rotation'], EmploymentType.ROTATIONAL),
+    (['seasonal', 'season'], EmploymentType.SEASONAL),
+    (['contract', 'temporary'], EmploymentType.TEMPORARY),
+])
+_DEPARTMENT_PATTERNS = tuple((re.compile('|'.join(map(re.escape, words))), value) for words, value in [
+    (['deckhand', 'bosun', 'mate', 'captain', 'officer', 'deck'], Department.DECK),
+    (['stewardess', 'steward', 'interior', 'housekeeping', 'butler'], Department.INTERIOR),
+    (['engineer', 'mechanic', 'eto', 'technical'], Department.ENGINEERING),
+    (['chef', 'cook', 'galley', 'kitchen'], Department.GALLEY),
+])
+_VESSEL_TYPE_PATTERNS = tuple((re.compile('|'.join(map(re.escape, words))), value) for words, value in [
+    (['sail'], VesselType.SAILING_YACHT),
+    (['catamaran'], VesselType.CATAMARAN),
+    (['superyacht', 'super yacht'], VesselType.SUPER_YACHT),
+    (['expedition'], VesselType.EXPEDITION),
+])
+
+JOB_ROWS_SELECTOR = '#ContentPlaceHolder1_RepJobAnnouncement tr:not(.head)'
+
+# Browser contexts the shared pool hands out at once
+BROWSER_POOL_SIZE = 4
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Requests aborted in scraping contexts: we only read the DOM text, so images, fonts, media,
+# stylesheets and trackers are wasted bandwidth and parse time
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+BLOCKED_URL_RE = re.compile(r'google-analytics|googletagmanager|doubleclick|hotjar|facebook\.net')
+
+# Reads every listing row in one page.evaluate round-trip instead of a Playwright call per
+# cell: trimmed cell texts plus the first non-javascript link found in the first five cells
+EXTRACT_ROWS_JS = """
+(selector) => Array.from(document.querySelectorAll(selector), (row) => {
+    const cells = Array.from(row.querySelectorAll('td'));
+    let href = null;
+    for (const cell of cells.slice(0, 5)) {
+        const link = cell.querySelector('a');
+        const value = link && link.getAttribute('href');
+        if (value && !value.startsWith('javascript:')) {
+            href = value;
+            break;
+        }
+    }
+    return {cells: cells.map((cell) => (cell.textContent || '').trim()), href};
+})
+"""
+
+
+@lru_cache(maxsize=4096)
+def _parse_posted_date(date_text: str, today: date) -> Optional[datetime]:
+    """Parse a posted-date string.
+    
+    Memoized per input string; ``today`` is only part of the cache key so that
+    relative dates ("2 days ago") are re-parsed once the day rolls over.
+    """
+    # Cheap strict matches first: YYYY-MM-DD / YYYY/MM/DD, then full ISO 8601
+    match = _FAST_DATE_RE.match(date_text)
+    if match:
+        try:
+            return datetime(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
+            pass
+    try:
+        parsed = datetime.fromisoformat(date_text)
+    except ValueError:
+        pass
+    else:
+        # Stored dates are naive UTC; convert an explicit offset rather than dropping it
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_text, fmt)
+        except ValueError:
+            continue
+    
+    import dateparser
+    return dateparser.parse(date_text, settings={'RETURN_AS_TIMEZONE_AWARE': False})
+
+
+class BrowserPool:
+    """Keeps one Chromium process alive across scrapes; each user gets a fresh context
+    
+    The shared browser lives between ``async with browser_pool:`` and its exit, on
+    the event loop that opened the pool; entry points (app lifespan, CLI) open it.
+    Used outside an open pool, or from another event loop, context() launches a
+    browser just for that context and shuts it down afterwards. At most
+    max_contexts shared contexts are open at once; a crashed browser is relaunched.
+    """
+    
+    def __init__(self, max_contexts: int = BROWSER_POOL_SIZE):
+        self.max_contexts = max_contexts
+        self._playwright = None
+        self._browser = None
+        self._loop = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+    
+    async def __aenter__(self):
+        if self._loop is not None:
+            raise RuntimeError("BrowserPool is already open")
+        # Playwright objects are bound to the loop that created them
+        self._loop = asyncio.get_running_loop()
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_contexts)
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def _shared_browser(self):
+        """Return the pool's browser, launching Playwright/Chromium if there's no live one"""
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+    
+    @asynccontextmanager
+    async def context(self, **kwargs):
+        """Yield a new browser context (closed on exit), from the shared browser when open"""
+        if self._loop is not asyncio.get_running_loop():
+            async with async_playwright() as playwright:
+                browser = await playwright.chromium.launch(headless=True)
+                try:
+                    context = await browser.new_context(**kwargs)
+                    try:
+                        yield context
+                    finally:
+                        await context.close()
+                finally:
+                    await browser.close()
+            return
+        
+        async with self._slots:
+            browser = await self._shared_browser()
+            context = await browser.new_context(**kwargs)
+            try:
+                yield context
+            finally:
+                await context.close()
+    
+    async def close(self):
+        """Shut down the shared browser and Playwright; must run on the loop that opened the pool"""
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+        except Exception as e:
+            logger.error(f"Error closing browser pool: {e}")
+        finally:
+            self._browser = None
+            self._playwright = None
+            self._loop = None
+            self._lock = None
+            self._slots = None
+
+
+browser_pool = BrowserPool()
+
+
+async def _block_unneeded_requests(route):
+    """Playwright route handler: abort assets and trackers, let everything else through"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
 @register_scraper
 class Daywork123Scraper(BaseScraper):
     """Production-grade Daywork123.com scraper with anti-detection"""
@@ -35,6 +215,8 @@ class Daywork123Scraper(BaseScraper):
                 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             ]
         }
+        # Reference time for posted dates and extraction stamps, fixed once per scrape_jobs pass
+        self._now: Optional[datetime] = None
     
     @property
     def source_name(self) -> str:
@@ -49,19 +231,20 @@ class Daywork123Scraper(BaseScraper):
                          filters: Optional[Dict[str, Any]] = None) -> AsyncIterator[UniversalJob]:
         """Scrape jobs from Daywork123.com"""
         logger.info(f"Starting Daywork123 scraper for {max_pages} pages")
+        self._now = datetime.utcnow()
         
         try:
-            from playwright.async_api import async_playwright
+            if not PLAYWRIGHT_AVAILABLE:
+                raise ImportError("Playwright not available. Install with: pip install playwright")
             
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                )
+            # Service workers would bypass request routing, so block them too
+            async with browser_pool.context(user_agent=USER_AGENT, service_workers='block') as context:
+                await context.route('**/*', _block_unneeded_requests)
                 page = await context.new_page()
                 
-                # Navigate to jobs page
-                await page.goto(f"{self.base_url}/JobAnnouncementList.aspx", wait_until='networkidle')
+                # Navigate to jobs page; the listing-table wait below is the real readiness check,
+                # so don't wait for the network to go idle (ads/analytics keep it busy)
+                await page.goto(f"{self.base_url}/JobAnnouncementList.aspx", wait_until='domcontentloaded')
                 
                 for page_num in range(1, max_pages + 1):
                     logger.info(f"Scraping Daywork123 page {page_num}")
@@ -69,19 +252,18 @@ class Daywork123Scraper(BaseScraper):
                     if page_num > 1:
                         # Navigate to next page
                         next_url = f"{self.base_url}/JobAnnouncementList.aspx?page={page_num}"
-                        await page.goto(next_url, wait_until='networkidle')
+                        await page.goto(next_url, wait_until='domcontentloaded')
                     
                     # Wait for job listings to load (table structure)
                     await page.wait_for_selector('#ContentPlaceHolder1_RepJobAnnouncement', timeout=10000)
                     
-                    # Extract job listings from table rows
-                    job_elements = await page.query_selector_all('#ContentPlaceHolder1_RepJobAnnouncement tr:not(.head)')
+                    # Pull every row's data out of the page in a single round-trip
+                    rows = await page.evaluate(EXTRACT_ROWS_JS, JOB_ROWS_SELECTOR)
                     
-                    # Extract all job data immediately to avoid context issues
                     jobs_found = 0
-                    for element in job_elements:
+                    for row in rows:
                         try:
-                            universal_job = await self._extract_job_from_element(element, page)
+                            universal_job = self._extract_job_from_row(row, page.url)
                             if universal_job:
                                 yield universal_job
                                 jobs_found += 1
@@ -99,30 +281,15 @@ class Daywork123Scraper(BaseScraper):
                     if page_num < max_pages:
                         await asyncio.sleep(2)
                 
-                await browser.close()
-                
         except Exception as e:
             logger.error(f"Error in Daywork123 scraper: {e}")
             raise
     
-    async def _extract_job_from_element(self, element, page) -> Optional[UniversalJob]:
-        """Extract job data from a single job element (table row) and return UniversalJob"""
+    def _extract_job_from_row(self, row: Dict[str, Any], page_url: Optional[str]) -> Optional[UniversalJob]:
+        """Build a UniversalJob from one listing row as returned by EXTRACT_ROWS_JS"""
         try:
-            # Extract all data immediately to avoid context issues
-            cells = await element.query_selector_all('td')
-            if len(cells) < 3:  # Need at least ID, title, and other info
-                return None
-            
-            # Extract all text content immediately
-            cell_texts = []
-            for cell in cells:
-                try:
-                    text = await cell.text_content()
-                    cell_texts.append(text.strip() if text else "")
-                except Exception:
-                    cell_texts.append("")
-            
-            if len(cell_texts) < 3:
+            cell_texts = row.get('cells') or []
+            if len(cell_texts) < 3:  # Need at least ID, title, and other info
                 return None
             
             # Extract job ID from first cell
@@ -171,21 +338,17 @@ class Daywork123Scraper(BaseScraper):
             # Date is in cell 1 (was being used as title)
             date_posted_str = cell_texts[1] if len(cell_texts) > 1 else ""
             
-            # Try to get the job URL from any cell with a link
-            job_url = f"{self.base_url}/JobAnnouncementList.aspx"  # Default
-            try:
-                for i, cell in enumerate(cells[:5]):  # Check first 5 cells for links
-                    link_elem = await cell.query_selector('a')
-                    if link_elem:
-                        href = await link_elem.get_attribute('href')
-                        if href and not href.startswith('javascript:'):
-                            job_url = urljoin(self.base_url, href)
-                            break
-            except Exception:
-                pass  # Use default URL
+            # Job URL from the first usable link in the row, else the listing page
+            href = row.get('href')
+            job_url = urljoin(self.base_url, href) if href else f"{self.base_url}/JobAnnouncementList.aspx"
             
             # Parse date
-            posted_date = self._parse_date(date_posted_str) if date_posted_str else datetime.utcnow()
+            now = self._now or datetime.utcnow()
+            # Rows without a date count as posted today (day-granular, so the content hash is stable)
+            posted_date = (
+                self._parse_date(date_posted_str) if date_posted_str
+                else now.replace(hour=0, minute=0, second=0, microsecond=0)
+            )
             
             # Parse employment type from title
             employment_type = self._detect_employment_type(title)
@@ -196,6 +359,9 @@ class Daywork123Scraper(BaseScraper):
             # Parse vessel type (if any info available)
             vessel_type = self._detect_vessel_type(title + " " + description)
             
+            # Cell values as scraped, before they're fitted to the columns below
+            cells = {'company': company, 'location': location, 'description': description}
+            
             # Ensure all fields respect database constraints
             title = title[:255] if title else ""  # title field is 255 chars
             company = company[:100] if company else "Daywork123"  # company field is 100 chars
@@ -216,12 +382,16 @@ class Daywork123Scraper(BaseScraper):
                 'external_id': job_id
             })
             
-            # Create raw data for debugging
+            # Create raw data for debugging; ID, company, description and location
+            # cells are already stored in their own columns, unless they had to be cut down
             raw_data = {
-                'job_id': job_id,
-                'cell_texts': cell_texts,
-                'extraction_timestamp': datetime.utcnow().isoformat(),
-                'page_url': page.url if page else None
+                'posted_text': date_posted_str,
+                'extra_cells': cell_texts[5:],
+                'extraction_timestamp': now.isoformat(),
+                'page_url': page_url,
+                **(self._compact_raw_data(
+                    cells, {'company': company, 'location': location, 'description': description}
+                ) or {})
             }
             
             # Create UniversalJob object
@@ -249,40 +419,6 @@ class Daywork123Scraper(BaseScraper):
             logger.error(f"Error extracting job element: {e}")
             return None
     
-    async def _get_job_details(self, job_url: str, page) -> Dict[str, Any]:
-        """Get detailed job information from job page"""
-        try:
-            await page.goto(job_url, wait_until='networkidle')
-            
-            # Extract detailed description
-            desc_elem = await page.query_selector('.job-details, .full-description')
-            full_description = await desc_elem.text_content() if desc_elem else ""
-            
-            # Extract requirements
-            req_elem = await page.query_selector('.requirements, .job-requirements')
-            requirements_text = await req_elem.text_content() if req_elem else ""
-            requirements = self._parse_requirements(requirements_text)
-            
-            # Extract benefits
-            benefits_elem = await page.query_selector('.benefits, .job-benefits')
-            benefits_text = await benefits_elem.text_content() if benefits_elem else ""
-            benefits = self._parse_benefits(benefits_text)
-            
-            # Extract vessel info
-            vessel_elem = await page.query_selector('.vessel-info, .yacht-details')
-            vessel_info = await vessel_elem.text_content() if vessel_elem else ""
-            
-            return {
-                'full_description': full_description,
-                'requirements': requirements,
-                'benefits': benefits,
-                'vessel_info': vessel_info
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting job details: {e}")
-            return {}
-    
     def _normalize_job(self, raw_job: Dict[str, Any]) -> UniversalJob:
         """Convert raw job data to UniversalJob format"""
         # Parse employment type
@@ -313,7 +449,7 @@ class Daywork123Scraper(BaseScraper):
             benefits=raw_job.get('benefits', []),
             posted_date=raw_job.get('posted_date'),
             quality_score=quality_score,
-            raw_data=raw_job
+            raw_data=self._compact_raw_data(raw_job)
         )
     
     def _extract_job_id(self, url: str) -> str:
@@ -324,83 +460,39 @@ class Daywork123Scraper(BaseScraper):
         return match.group(1) if match else url
     
     def _parse_date(self, date_text: str) -> Optional[datetime]:
-        """Parse posted date from text"""
+        """Parse posted date from text, truncated to the day"""
         if not date_text:
             return None
         
-        # Handle relative dates like "2 days ago", "1 week ago"
-        import dateparser
-        try:
-            return dateparser.parse(date_text, settings={'RETURN_AS_TIMEZONE_AWARE': False})
-        except:
-            return datetime.utcnow()
-    
-    def _parse_requirements(self, text: str) -> List[str]:
-        """Parse requirements from text"""
-        if not text:
-            return []
-        
-        # Split by common delimiters
-        requirements = re.split(r'[•·\-\n]', text)
-        return [req.strip() for req in requirements if req.strip()]
-    
-    def _parse_benefits(self, text: str) -> List[str]:
-        """Parse benefits from text"""
-        if not text:
-            return []
-        
-        benefits = re.split(r'[•·\-\n]', text)
-        return [benefit.strip() for benefit in benefits if benefit.strip()]
+        today = (self._now or datetime.utcnow()).replace(hour=0, minute=0, second=0, microsecond=0)
+        # Handle absolute dates and relative ones like "2 days ago", "1 week ago"
+        return self._day_precision_date(
+            date_text.strip(), lambda text: _parse_posted_date(text, today.date()), today
+        )
     
     def _detect_employment_type(self, title: str) -> Optional[EmploymentType]:
         """Detect employment type from job title"""
         title_lower = title.lower()
-        
-        if any(word in title_lower for word in ['daywork', 'day work', 'daily']):
-            return EmploymentType.DAYWORK
-        elif any(word in title_lower for word in ['rotational', 'rotation']):
-            return EmploymentType.ROTATIONAL
-        elif any(word in title_lower for word in ['seasonal', 'season']):
-            return EmploymentType.SEASONAL
-        elif any(word in title_lower for word in ['contract', 'temporary']):
-            return EmploymentType.TEMPORARY
-        else:
-            return EmploymentType.PERMANENT
+        for pattern, employment_type in _EMPLOYMENT_TYPE_PATTERNS:
+            if pattern.search(title_lower):
+                return employment_type
+        return EmploymentType.PERMANENT
     
     def _detect_department(self, title: str) -> Optional[Department]:
         """Detect department from job title"""
         title_lower = title.lower()
-        
-        deck_keywords = ['deckhand', 'bosun', 'mate', 'captain', 'officer', 'deck']
-        interior_keywords = ['stewardess', 'steward', 'interior', 'housekeeping', 'butler']
-        engineering_keywords = ['engineer', 'mechanic', 'eto', 'technical']
-        galley_keywords = ['chef', 'cook', 'galley', 'kitchen']
-        
-        if any(keyword in title_lower for keyword in deck_keywords):
-            return Department.DECK
-        elif any(keyword in title_lower for keyword in interior_keywords):
-            return Department.INTERIOR
-        elif any(keyword in title_lower for keyword in engineering_keywords):
-            return Department.ENGINEERING
-        elif any(keyword in title_lower for keyword in galley_keywords):
-            return Department.GALLEY
-        else:
-            return Department.OTHER
+        for pattern, department in _DEPARTMENT_PATTERNS:
+            if pattern.search(title_lower):
+                return department
+        return Department.OTHER
     
     def _detect_vessel_type(self, text: str) -> Optional[VesselType]:
         """Detect vessel type from text"""
         text_lower = text.lower()
-        
-        if 'sailing' in text_lower or 'sail' in text_lower:
-            return VesselType.SAILING_YACHT
-        elif 'catamaran' in text_lower:
-            return VesselType.CATAMARAN
-        elif 'superyacht' in text_lower or 'super yacht' in text_lower:
-            return VesselType.SUPER_YACHT
-        elif 'expedition' in text_lower:
-            return VesselType.EXPEDITION
-        else:
-            return VesselType.MOTOR_YACHT
+        for pattern, vessel_type in _VESSEL_TYPE_PATTERNS:
+            if pattern.search(text_lower):
+                return vessel_type
+        return VesselType.MOTOR_YACHT
     
     def _calculate_quality_score(self, job: Dict[str, Any]) -> float:
         """Calculate data quality score (0-1)"""
@@ -430,14 +522,9 @@ class Daywork123Scraper(BaseScraper):
             return False
         
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context()
+            async with browser_pool.context() as context:
                 page = await context.new_page()
-                
                 response = await page.goto(self.base_url, timeout=10000)
-                await browser.close()
-                
                 return response.status == 200
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
@@ -447,111 +534,12 @@ class Daywork123Scraper(BaseScraper):
         """Return supported filter parameters"""
         return ["location", "date_range", "job_type", "vessel_size", "salary_range"]
     
-    async def save_jobs_to_db(self, jobs: List[UniversalJob]) -> int:
-        """Save scraped jobs to yacht_jobs.db
-        
-        Args:
-            jobs: List of UniversalJob objects to save
-            
-        Returns:
-            Number of jobs successfully saved
-        """
-        if not jobs:
-            return 0
-            
-        saved_count = 0
-        
-        with SessionLocal() as db:
-            for job in jobs:
-                try:
-                    # Check if job already exists
-                    existing_job = db.query(Job).filter(
-                        Job.external_id == job.external_id,
-                        Job.source == job.source
-                    ).first()
-                    
-                    if existing_job:
-                        # Update existing job
-                        existing_job.title = job.title
-                        existing_job.company = job.company
-                        existing_job.location = job.location
-                        existing_job.country = job.country
-                        existing_job.region = job.region
-                        existing_job.description = job.description
-                        existing_job.salary_range = job.salary_range
-                        existing_job.salary_currency = job.salary_currency
-                        existing_job.salary_period = job.salary_period
-                        existing_job.employment_type = job.employment_type.value if hasattr(job.employment_type, 'value') else job.employment_type
-                        existing_job.job_type = job.employment_type.value if hasattr(job.employment_type, 'value') else job.employment_type
-                        existing_job.department = job.department.value if hasattr(job.department, 'value') else job.department
-                        existing_job.vessel_type = job.vessel_type.value if hasattr(job.vessel_type, 'value') else job.vessel_type
-                        existing_job.vessel_size = job.vessel_size
-                        existing_job.vessel_name = job.vessel_name
-                        existing_job.position_level = job.position_level
-                        existing_job.start_date = job.start_date
-                        existing_job.requirements = job.requirements
-                        existing_job.benefits = job.benefits
-                        existing_job.posted_date = job.posted_date
-                        existing_job.quality_score = job.quality_score
-                        existing_job.raw_data = job.raw_data
-                        existing_job.updated_at = datetime.utcnow()
-                        
-                        logger.debug(f"Updated existing job: {job.title}")
-                    else:
-                        # Create new job
-                        db_job = Job(
-                            external_id=job.external_id,
-                            title=job.title,
-                            company=job.company,
-                            location=job.location,
-                            country=job.country,
-                            region=job.region,
-                            description=job.description,
-                            source=job.source,
-                            source_url=str(job.source_url),
-                            salary_range=job.salary_range,
-                            salary_currency=job.salary_currency,
-                            salary_period=job.salary_period,
-                            employment_type=job.employment_type.value if hasattr(job.employment_type, 'value') else job.employment_type,
-                            job_type=job.employment_type.value if hasattr(job.employment_type, 'value') else job.employment_type,
-                            department=job.department.value if hasattr(job.department, 'value') else job.department,
-                            vessel_type=job.vessel_type.value if hasattr(job.vessel_type, 'value') else job.vessel_type,
-                            vessel_size=job.vessel_size,
-                            vessel_name=job.vessel_name,
-                            position_level=job.position_level,
-                            start_date=job.start_date,
-                            requirements=job.requirements,
-                            benefits=job.benefits,
-                            posted_date=job.posted_date,
-                            posted_at=job.posted_date,
-                            quality_score=job.quality_score,
-                            raw_data=job.raw_data,
-                            scraped_at=job.scraped_at,
-                            created_at=datetime.utcnow(),
-                            updated_at=datetime.utcnow()
-                        )
-                        db.add(db_job)
-                        logger.debug(f"Added new job: {job.title}")
-                    
-                    saved_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error saving job {job.title}: {e}")
-                    continue
-            
-            try:
-                db.commit()
-                logger.info(f"Successfully saved {saved_count} jobs to database")
-            except Exception as e:
-                logger.error(f"Error committing jobs to database: {e}")
-                db.rollback()
-                return 0
-        
-        return saved_count
-    
     async def scrape_and_save_jobs(self, max_pages: int = 5, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Scrape jobs and save them to database
         
+        Jobs are saved in batches through a JobBatcher as they are scraped, so
+        writes overlap page fetches and memory doesn't grow with max_pages.
+        
         Args:
             max_pages: Maximum number of pages to scrape
             filters: Optional filters to apply
@@ -560,21 +548,21 @@ class Daywork123Scraper(BaseScraper):
             Dictionary with scraping results
         """
         start_time = datetime.utcnow()
-        jobs_list = []
+        jobs_found = 0
+        batcher = JobBatcher(self.save_jobs_to_db)
         
         try:
-            # Collect all jobs from scraping
             async for job in self.scrape_jobs(max_pages, filters):
-                jobs_list.append(job)
+                jobs_found += 1
+                await batcher.add(job)
             
-            # Save to database
-            saved_count = await self.save_jobs_to_db(jobs_list)
+            saved_count = await batcher.flush()
             
             duration = (datetime.utcnow() - start_time).total_seconds()
             
             result = {
                 "source": self.source_name,
-                "jobs_found": len(jobs_list),
+                "jobs_found": jobs_found,
                 "jobs_saved": saved_count,
                 "duration": duration,
                 "timestamp": datetime.utcnow(),
@@ -582,17 +570,24 @@ class Daywork123Scraper(BaseScraper):
                 "errors": []
             }
             
-            logger.info(f"Daywork123 scraping completed: {len(jobs_list)} found, {saved_count} saved")
+            logger.info(f"Daywork123 scraping completed: {jobs_found} found, {saved_count} saved")
             return result
             
         except Exception as e:
-            duration = (datetime.utcnow() - start_time).total_seconds()
             logger.error(f"Error in Daywork123 scrape_and_save_jobs: {e}")
+            # Keep whatever was scraped before the failure; if that save fails too (e.g. the
+            # first error came from the database), report the original error, not the flush's
+            try:
+                saved_count = await batcher.flush()
+            except Exception as flush_error:
+                logger.error(f"Error saving remaining Daywork123 jobs: {flush_error}")
+                saved_count = batcher.saved
+            duration = (datetime.utcnow() - start_time).total_seconds()
             
             return {
                 "source": self.source_name,
-                "jobs_found": 0,
-                "jobs_saved": 0,
+                "jobs_found": jobs_found,
+                "jobs_saved": saved_count,
                 "duration": duration,
                 "timestamp": datetime.utcnow(),
                 "success": False,
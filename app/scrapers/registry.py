@@ -1,5 +1,6 @@
 """Registry for managing pluggable scrapers"""
-from typing import Dict, Type, List
+from functools import lru_cache
+from typing import Dict, Type, List, Tuple
 from .base import BaseScraper
 
 class ScraperRegistry:
@@ -12,6 +13,7 @@ class ScraperRegistry:
         """Register a new scraper"""
         instance = scraper_class()
         cls._scrapers[instance.source_name] = scraper_class
+        cls._scraper_names.cache_clear()
     
     @classmethod
     def get_scraper(cls, source_name: str) -> BaseScraper:
@@ -23,7 +25,14 @@ class ScraperRegistry:
     @classmethod
     def list_scrapers(cls) -> List[str]:
         """List all registered scrapers"""
-        return list(cls._scrapers.keys())
+        # Copy so callers can't mutate the cached names
+        return list(cls._scraper_names())
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _scraper_names(cls) -> Tuple[str, ...]:
+        """Registered source names, cached until the next register()"""
+        return tuple(cls._scrapers)
     
     @classmethod
     def get_all_scrapers(cls) -> List[BaseScraper]:
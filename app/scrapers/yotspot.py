@@ -1,9 +1,10 @@
 """Yotspot.com scraper refactored for pluggable architecture"""
 import asyncio
 import logging
+import random
 import aiohttp
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
 import re
 from urllib.parse import urljoin
 
@@ -12,6 +13,50 @@ from .registry import register_scraper
 
 logger = logging.getLogger(__name__)
 
+# Precompiled once per process rather than per card/job
+_JOB_CARD_CLASS_RE = re.compile(r'job-listing|job-card')
+_JOB_ARTICLE_CLASS_RE = re.compile(r'job')
+_JOB_ID_RE = re.compile(r'/jobs/(\d+)')
+
+# Card info-list classifiers: one alternation per field (substring match on lowercased text)
+_LOCATION_RE = re.compile('|'.join(map(re.escape, [
+    'miami', 'fort lauderdale', 'caribbean', 'mediterranean', 'europe',
+])))
+_JOB_TYPE_RE = re.compile('|'.join(map(re.escape, [
+    'permanent', 'temporary', 'contract', 'seasonal',
+])))
+_POSTED_DATE_RE = re.compile('|'.join(map(re.escape, [
+    'posted', '2024', '2025', 'jan', 'feb', 'mar', 'apr', 'may', 'jun',
+    'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+])))
+_SALARY_RE = re.compile('|'.join(map(re.escape, ['eur', 'usd', 'gbp', '€', '$', '£'])))
+
+# Relative posted dates handled without dateparser (checked against the lowercased text)
+_TODAY_TOKENS = ('today',)
+_YDAY_TOKEN = 'yesterday'
+_AGO_SUFFIXES = (
+    (' days ago', timedelta(days=1)),
+    (' day ago', timedelta(days=1)),
+    (' hours ago', timedelta(hours=1)),
+    (' hour ago', timedelta(hours=1)),
+)
+_ONE_DAY = timedelta(days=1)
+
+# Shared HTTP connection pool: kept-alive connections per host and cached DNS lookups (s)
+CONNECTOR_LIMIT_PER_HOST = 8
+DNS_CACHE_TTL = 300
+
+SEARCH_PATH = '/job-search.html'
+
+# Listing pages fetched at once; each fetch still waits a jittered request_delay in its slot
+MAX_CONCURRENT_PAGES = 3
+
+
+def _dateparser_parse(date_text: str) -> Optional[datetime]:
+    """Parse free-form date text with dateparser (imported on first use)"""
+    from dateparser import parse
+    return parse(date_text, settings={'RETURN_AS_TIMEZONE_AWARE': False})
+
 @register_scraper
 class YotspotScraper(BaseScraper):
     """Refactored Yotspot.com scraper implementing pluggable interface"""
@@ -30,6 +75,10 @@ class YotspotScraper(BaseScraper):
                 'Upgrade-Insecure-Requests': '1',
             }
         }
+        # Created lazily (needs a running loop) and reused by test_connection and scrape_jobs
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Reference time for relative posted dates, fixed once per scrape_jobs pass
+        self._now: Optional[datetime] = None
     
     @property
     def source_name(self) -> str:
@@ -39,70 +88,116 @@ class YotspotScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://www.yotspot.com"
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared ClientSession, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                    ttl_dns_cache=DNS_CACHE_TTL
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.config['timeout']),
+                headers=self.config['headers']
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared ClientSession"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     async def scrape_jobs(self, max_pages: int = 5, filters: Optional[Dict[str, Any]] = None):
-        """Scrape jobs from Yotspot.com using aiohttp"""
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config['timeout']),
-            headers=self.config['headers']
-        ) as session:
-            
-            for page in range(1, max_pages + 1):
+        """Scrape jobs from Yotspot.com using aiohttp
+        
+        Pages are fetched concurrently (at most MAX_CONCURRENT_PAGES at a time)
+        but jobs are still yielded in page order.
+        """
+        self._now = datetime.utcnow()
+        session = self._get_session()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+        
+        async def fetch(page: int) -> Optional[List[Dict[str, Any]]]:
+            async with semaphore:
                 logger.info(f"Scraping Yotspot page {page}")
-                
+                jobs = await self._scrape_page(session, page, filters)
+                # Hold the slot a little to stay polite to the site. Not in a finally: a fetch
+                # cancelled on early exit must not sleep before the session can close
+                await asyncio.sleep(self.config['request_delay'] * random.uniform(0.5, 1.5))
+                return jobs
+        
+        tasks = [asyncio.create_task(fetch(page)) for page in range(1, max_pages + 1)]
+        # Listings shift between pages while we paginate and cards can repeat; yield each job once
+        seen = set()
+        try:
+            for page, task in enumerate(tasks, start=1):
                 try:
-                    jobs = await self._scrape_page(session, page, filters)
+                    jobs = await task
+                    if jobs is None:
+                        continue  # Fetch/parse failed (already logged); later pages may still have jobs
+                    if not jobs:
+                        # Past the last page of results; later pages will be empty too
+                        logger.warning(f"No jobs found on page {page}, stopping pagination")
+                        break
                     for job in jobs:
+                        key = job.get('url') or job.get('external_id')
+                        if key:
+                            if key in seen:
+                                continue
+                            seen.add(key)
                         yield self._normalize_job(job)
-                        
-                    # Add delay between pages
-                    if page < max_pages:
-                        await asyncio.sleep(self.config['request_delay'])
-                        
                 except Exception as e:
                     logger.error(f"Error scraping page {page}: {e}")
                     continue
+        finally:
+            # Stop outstanding fetches if the consumer stops early or scraping fails
+            for task in tasks:
+                task.cancel()
+            # Let the cancellations land before the caller can close the shared session
+            await asyncio.gather(*tasks, return_exceptions=True)
     
-    async def _scrape_page(self, session: aiohttp.ClientSession, page: int, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Scrape a single page of job listings"""
-        url = f"{self.base_url}/job-search.html?page={page}"
+    async def _scrape_page(self, session: aiohttp.ClientSession, page: int, filters: Optional[Dict[str, Any]] = None) -> Optional[List[Dict[str, Any]]]:
+        """Scrape a single page of job listings
+        
+        Returns None if the page couldn't be fetched or parsed, as opposed to an
+        empty list for a page that has no listings.
+        """
+        url = urljoin(self.base_url, SEARCH_PATH)
         
-        # Add filters to URL if provided
+        # Add filters to the query if provided; aiohttp URL-encodes the values
+        params = {'page': page}
         if filters:
-            params = []
-            if filters.get('location'):
-                params.append(f"location={filters['location']}")
-            if filters.get('department'):
-                params.append(f"department={filters['department']}")
-            if params:
-                url += "&" + "&".join(params)
+            for key in ('location', 'department'):
+                if filters.get(key):
+                    params[key] = filters[key]
         
         try:
-            async with session.get(url) as response:
+            async with session.get(url, params=params) as response:
                 if response.status != 200:
-                    logger.error(f"HTTP {response.status} for {url}")
-                    return []
+                    logger.error(f"HTTP {response.status} for {response.url}")
+                    return None
                 
                 html = await response.text()
                 return await self._parse_job_listings(html)
                 
         except Exception as e:
             logger.error(f"Error fetching page {page}: {e}")
-            return []
+            return None
     
-    async def _parse_job_listings(self, html: str) -> List[Dict[str, Any]]:
-        """Parse job listings from HTML"""
+    async def _parse_job_listings(self, html: str) -> Optional[List[Dict[str, Any]]]:
+        """Parse job listings from HTML; None if the page couldn't be parsed"""
         try:
             from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             
             jobs = []
             job_cards = soup.find_all('div', class_='job-item')
             
             if not job_cards:
                 # Try alternative selectors
-                job_cards = soup.find_all('div', class_=re.compile(r'job-listing|job-card'))
+                job_cards = soup.find_all('div', class_=_JOB_CARD_CLASS_RE)
                 if not job_cards:
-                    job_cards = soup.find_all('article', class_=re.compile(r'job'))
+                    job_cards = soup.find_all('article', class_=_JOB_ARTICLE_CLASS_RE)
                     if not job_cards:
                         job_cards = soup.find_all('div', attrs={'data-job-id': True})
             
@@ -115,7 +210,7 @@ class YotspotScraper(BaseScraper):
             
         except Exception as e:
             logger.error(f"Error parsing job listings: {e}")
-            return []
+            return None
     
     def _extract_job_data(self, card) -> Optional[Dict[str, Any]]:
         """Extract job data from a single job card"""
@@ -137,51 +232,32 @@ class YotspotScraper(BaseScraper):
             # Company name - default for yotspot
             job_data['company'] = "Yotspot"
             
-            # Location - extract from job-item__info
+            # Location, job type, posted date and salary from job-item__info, in one pass;
+            # each field takes the first item that matches it
             location = "Unknown"
-            info_list = card.find('ul', class_='job-item__info')
-            if info_list:
-                info_items = info_list.find_all('li')
-                for item in info_items:
-                    item_text = item.get_text(strip=True)
-                    # Look for location patterns
-                    if any(loc in item_text.lower() for loc in ['miami', 'fort lauderdale', 'caribbean', 'mediterranean', 'europe']):
-                        location = item_text
-                        break
-            
-            job_data['location'] = location
-            
-            # Job type - extract from job-item__info
             job_type = None
-            if info_list:
-                for item in info_list.find_all('li'):
-                    item_text = item.get_text(strip=True)
-                    if any(type_word in item_text.lower() for type_word in ['permanent', 'temporary', 'contract', 'seasonal']):
-                        job_type = item_text
-                        break
-            
-            job_data['job_type'] = job_type
-            
-            # Posted date - extract from job-item__info
             posted_date = None
-            if info_list:
-                for item in info_list.find_all('li'):
-                    item_text = item.get_text(strip=True)
-                    if 'posted' in item_text.lower() or any(date_indicator in item_text.lower() for date_indicator in ['2024', '2025', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']):
-                        posted_date = self._parse_date(item_text)
-                        break
-            
-            job_data['posted_date'] = posted_date
-            
-            # Salary - extract from job-item__info
             salary = None
+            found_location = found_posted = False
+            info_list = card.find('ul', class_='job-item__info')
             if info_list:
                 for item in info_list.find_all('li'):
                     item_text = item.get_text(strip=True)
-                    if any(currency in item_text.lower() for currency in ['eur', 'usd', 'gbp', '€', '$', '£']):
+                    item_lower = item_text.lower()
+                    if not found_location and _LOCATION_RE.search(item_lower):
+                        location = item_text
+                        found_location = True
+                    if job_type is None and _JOB_TYPE_RE.search(item_lower):
+                        job_type = item_text
+                    if not found_posted and _POSTED_DATE_RE.search(item_lower):
+                        posted_date = self._parse_date(item_text)
+                        found_posted = True
+                    if salary is None and _SALARY_RE.search(item_lower):
                         salary = item_text
-                        break
             
+            job_data['location'] = location
+            job_data['job_type'] = job_type
+            job_data['posted_date'] = posted_date
             job_data['salary'] = salary
             
             # Description - use title as description for now
@@ -200,19 +276,32 @@ class YotspotScraper(BaseScraper):
         """Extract job ID from URL"""
         if not url:
             return ""
-        match = re.search(r'/jobs/(\d+)', url)
+        match = _JOB_ID_RE.search(url)
         return match.group(1) if match else url
     
     def _parse_date(self, date_text: str) -> Optional[datetime]:
-        """Parse posted date from text"""
+        """Parse posted date from text, truncated to the day"""
         if not date_text:
             return None
         
-        try:
-            from dateparser import parse
-            return parse(date_text, settings={'RETURN_AS_TIMEZONE_AWARE': False})
-        except:
-            return datetime.utcnow()
+        # Fast path for the common relative forms; substring checks are far cheaper than dateparser
+        now = self._now or datetime.utcnow()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        s = date_text.lower()
+        if any(token in s for token in _TODAY_TOKENS):
+            return today
+        if _YDAY_TOKEN in s:
+            return today - _ONE_DAY
+        for suffix, unit in _AGO_SUFFIXES:
+            if s.endswith(suffix):
+                words = s[:-len(suffix)].split()
+                if words and words[-1].isdigit():
+                    # "48 hours ago" is two days back, so subtract from now before truncating
+                    ago = now - int(words[-1]) * unit
+                    return ago.replace(hour=0, minute=0, second=0, microsecond=0)
+                break
+        
+        return self._day_precision_date(date_text, _dateparser_parse, today)
     
     def _normalize_job(self, raw_job: Dict[str, Any]) -> UniversalJob:
         """Convert raw job data to UniversalJob format"""
@@ -242,7 +331,7 @@ class YotspotScraper(BaseScraper):
             description=raw_job.get('description', ''),
             posted_date=raw_job.get('posted_date'),
             quality_score=quality_score,
-            raw_data=raw_job
+            raw_data=self._compact_raw_data(raw_job)
         )
     
     def _detect_employment_type(self, job_type: str) -> Optional[EmploymentType]:
@@ -322,9 +411,8 @@ class YotspotScraper(BaseScraper):
     async def test_connection(self) -> bool:
         """Test Yotspot.com accessibility"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, timeout=10) as response:
-                    return response.status == 200
+            async with self._get_session().get(self.base_url, timeout=10) as response:
+                return response.status == 200
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
             return False
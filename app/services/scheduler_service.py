@@ -411,22 +411,8 @@ class SchedulerService:
             List of dictionaries with next run information
         """
         try:
-            jobs = self.scheduler.get_all_jobs_status()
-            next_runs = []
-            
-            for job in jobs:
-                if job.get('next_run_time'):
-                    next_runs.append({
-                        'job_id': job['id'],
-                        'job_name': job['name'],
-                        'next_run_time': job['next_run_time'],
-                        'period': job.get('kwargs', {}).get('period', 'unknown')
-                    })
-            
-            # Sort by next run time
-            next_runs.sort(key=lambda x: x['next_run_time'])
-            
-            return next_runs[:limit]
+            # Expands each period job into its upcoming cron slots, sorted by run time
+            return self.scheduler.get_upcoming_runs(limit=limit)
             
         except Exception as e:
             logger.error(f"Error getting next runs: {e}")
@@ -3,15 +3,15 @@ import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
 
 from app.scrapers.registry import ScraperRegistry
-from app.scrapers.base import UniversalJob
-from app.database import SessionLocal
-from app.models import Job
+from app.scrapers.base import BaseScraper, JobBatcher, UniversalJob
 
 logger = logging.getLogger(__name__)
 
+# Sources scraped at the same time by scrape_all_sources
+MAX_CONCURRENT_SOURCES = 4
+
 class ScrapingService:
     """Unified service for managing all scrapers"""
     
@@ -20,173 +20,100 @@ class ScrapingService:
     
     async def scrape_source(self, source_name: str, max_pages: int = 5) -> Dict[str, Any]:
         """Scrape a specific source"""
+        # Filled in as batches are saved, so a failed scrape still reports what reached the DB
+        counts = {"jobs_found": 0, "new_jobs": 0, "updated_jobs": 0}
         try:
             scraper = self.registry.get_scraper(source_name)
             
             start_time = datetime.utcnow()
-            jobs_found = 0
-            new_jobs = 0
-            updated_jobs = 0
             errors = []
             
-            # Collect all jobs
-            jobs = []
-            async for job in scraper.scrape_jobs(max_pages=max_pages):
-                jobs.append(job)
-                jobs_found += 1
-            
-            # Save to database
-            if jobs:
-                new_jobs, updated_jobs = await self._save_jobs(jobs)
+            # Stream jobs to the database in batches while scraping continues
+            try:
+                await self._scrape_and_save(scraper, max_pages, counts)
+            finally:
+                await scraper.close()
             
             duration = (datetime.utcnow() - start_time).total_seconds()
             
             result = {
                 "source": source_name,
-                "jobs_found": jobs_found,
-                "new_jobs": new_jobs,
-                "updated_jobs": updated_jobs,
+                **counts,
                 "errors": errors,
                 "duration": duration,
                 "timestamp": datetime.utcnow()
             }
             
-            logger.info(f"Scraped {source_name}: {jobs_found} found, {new_jobs} new, {updated_jobs} updated")
+            logger.info(
+                f"Scraped {source_name}: {counts['jobs_found']} found, "
+                f"{counts['new_jobs']} new, {counts['updated_jobs']} updated"
+            )
             return result
             
         except Exception as e:
             logger.error(f"Error scraping {source_name}: {e}")
             return {
                 "source": source_name,
-                "jobs_found": 0,
-                "new_jobs": 0,
-                "updated_jobs": 0,
+                **counts,
                 "errors": [str(e)],
                 "duration": 0,
                 "timestamp": datetime.utcnow()
             }
     
     async def scrape_all_sources(self, max_pages: int = 5) -> List[Dict[str, Any]]:
-        """Scrape all registered sources"""
-        results = []
-        sources = self.registry.list_scrapers()
+        """Scrape all registered sources concurrently
         
-        for source_name in sources:
-            result = await self.scrape_source(source_name, max_pages)
-            results.append(result)
-            
-            # Add delay between sources to be respectful
-            if source_name != sources[-1]:
-                await asyncio.sleep(30)
+        Each source is a different site, so they run side by side (at most
+        MAX_CONCURRENT_SOURCES at once) instead of back to back.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+        
+        async def run(source_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.scrape_source(source_name, max_pages)
         
-        return results
+        # scrape_source logs each result as it finishes and never raises
+        return await asyncio.gather(*(run(name) for name in self.registry.list_scrapers()))
     
     async def health_check_all(self) -> Dict[str, Any]:
-        """Health check for all scrapers"""
-        health_status = {}
-        
-        for scraper in self.registry.get_all_scrapers():
+        """Health check for all scrapers, probing every source concurrently"""
+        async def check(scraper) -> Dict[str, Any]:
             try:
-                health_status[scraper.source_name] = await scraper.health_check()
+                return await scraper.health_check()
             except Exception as e:
-                health_status[scraper.source_name] = {
+                return {
                     "source": scraper.source_name,
                     "accessible": False,
                     "status": "error",
                     "error": str(e)
                 }
+            finally:
+                await scraper.close()
         
-        return health_status
+        scrapers = self.registry.get_all_scrapers()
+        results = await asyncio.gather(*(check(scraper) for scraper in scrapers))
+        return {scraper.source_name: result for scraper, result in zip(scrapers, results)}
     
-    async def _save_jobs(self, jobs: List[UniversalJob]) -> tuple[int, int]:
-        """Save jobs to database with deduplication"""
-        new_jobs_count = 0
-        updated_jobs_count = 0
+    async def _scrape_and_save(self, scraper: BaseScraper, max_pages: int, counts: Dict[str, int]):
+        """Save scraped jobs through the scraper's upsert in batches as they arrive
         
-        with SessionLocal() as db:
-            for job in jobs:
-                try:
-                    # Check if job already exists
-                    existing_job = db.query(Job).filter(
-                        Job.external_id == job.external_id,
-                        Job.source == job.source
-                    ).first()
-                    
-                    if existing_job:
-                        # Update existing job
-                        existing_job.title = job.title
-                        existing_job.company = job.company
-                        existing_job.location = job.location
-                        existing_job.country = job.country
-                        existing_job.region = job.region
-                        existing_job.description = job.description
-                        existing_job.salary_range = job.salary_range
-                        existing_job.salary_currency = job.salary_currency
-                        existing_job.salary_period = job.salary_period
-                        existing_job.employment_type = job.employment_type.value if job.employment_type else None
-                        existing_job.job_type = job.employment_type.value if job.employment_type else None  # Keep compatibility
-                        existing_job.department = job.department.value if job.department else None
-                        existing_job.vessel_type = job.vessel_type.value if job.vessel_type else None
-                        existing_job.vessel_size = job.vessel_size
-                        existing_job.vessel_name = job.vessel_name
-                        existing_job.position_level = job.position_level
-                        existing_job.start_date = job.start_date
-                        existing_job.requirements = job.requirements
-                        existing_job.benefits = job.benefits
-                        existing_job.posted_date = job.posted_date
-                        existing_job.quality_score = job.quality_score
-                        existing_job.raw_data = job.raw_data
-                        existing_job.updated_at = datetime.utcnow()
-                        
-                        updated_jobs_count += 1
-                    else:
-                        # Create new job
-                        db_job = Job(
-                            external_id=job.external_id,
-                            title=job.title,
-                            company=job.company,
-                            location=job.location,
-                            country=job.country,
-                            region=job.region,
-                            description=job.description,
-                            source=job.source,
-                            source_url=str(job.source_url),
-                            salary_range=job.salary_range,
-                            salary_currency=job.salary_currency,
-                            salary_period=job.salary_period,
-                            employment_type=job.employment_type.value if job.employment_type else None,
-                            job_type=job.employment_type.value if job.employment_type else None,  # Keep compatibility
-                            department=job.department.value if job.department else None,
-                            vessel_type=job.vessel_type.value if job.vessel_type else None,
-                            vessel_size=job.vessel_size,
-                            vessel_name=job.vessel_name,
-                            position_level=job.position_level,
-                            start_date=job.start_date,
-                            requirements=job.requirements,
-                            benefits=job.benefits,
-                            posted_date=job.posted_date,
-                            posted_at=job.posted_date,  # Keep compatibility
-                            quality_score=job.quality_score,
-                            raw_data=job.raw_data,
-                            scraped_at=job.scraped_at,
-                            created_at=datetime.utcnow(),
-                            updated_at=datetime.utcnow()
-                        )
-                        db.add(db_job)
-                        new_jobs_count += 1
-                
-                except Exception as e:
-                    logger.error(f"Error saving job {job.title}: {e}")
-                    continue
-            
-            try:
-                db.commit()
-            except Exception as e:
-                logger.error(f"Error committing jobs to database: {e}")
-                db.rollback()
-                return 0, 0
+        counts ("jobs_found", "new_jobs", "updated_jobs") is updated in place as jobs
+        are scraped and batches are saved.
+        """
+        async def save(batch: List[UniversalJob]) -> int:
+            new, updated = await scraper.upsert_jobs(batch)
+            counts["new_jobs"] += new
+            counts["updated_jobs"] += updated
+            return new + updated
         
-        return new_jobs_count, updated_jobs_count
+        batcher = JobBatcher(save)
+        try:
+            async for job in scraper.scrape_jobs(max_pages=max_pages):
+                counts["jobs_found"] += 1
+                await batcher.add(job)
+        finally:
+            # Save what was scraped before surfacing a scraping error
+            await batcher.flush()
     
     def get_scraper_stats(self) -> Dict[str, Any]:
         """Get statistics for all scrapers"""
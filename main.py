@@ -2,28 +2,32 @@ from fastapi import FastAPI, Request, Depends, HTTPException, BackgroundTasks
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
-from sqlalchemy import func, Integer
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import func, case, Integer
 from datetime import datetime, timedelta
 import uvicorn
 import os
+import re
 from contextlib import asynccontextmanager
 
-from app.database import engine, get_db, Base
+from app.database import get_db, init_db
 from app.models import Job, ScrapingJob
 from app.scrapers.yotspot import YotspotScraper
 from app.scheduler import start_scheduler, stop_scheduler
+from app.scrapers.daywork123 import browser_pool
 
 # Create tables
-Base.metadata.create_all(bind=engine)
+init_db()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
-    start_scheduler()
-    yield
-    # Shutdown
-    stop_scheduler()
+    # The shared Chromium for Daywork123 scrapes lives as long as the app
+    async with browser_pool:
+        # Startup
+        start_scheduler()
+        yield
+        # Shutdown
+        stop_scheduler()
 
 app = FastAPI(
     title="YotCrew.app",
@@ -42,6 +46,27 @@ templates = Jinja2Templates(directory="templates")
 # Initialize scrapers
 scraper = YotspotScraper()
 
+# First number in a salary string, e.g. "€3,500 - 4,000/month" -> "3,500"
+SALARY_NUMBER_RE = re.compile(r'\d[\d,]*')
+
+def _title_sort_key(job):
+    return (job.get('title') or '').lower()
+
+def _salary_sort_key(job):
+    salary = job.get('salary_range') or job.get('salary') or ''
+    match = SALARY_NUMBER_RE.search(str(salary))
+    return int(match.group().replace(',', '')) if match else 0
+
+def _quality_sort_key(job):
+    return job.get('quality_score') or 0
+
+# Client-side sort keys for the jobs table; unknown fields fall back to title
+JOB_SORT_KEYS = {
+    "title": _title_sort_key,
+    "salary": _salary_sort_key,
+    "quality": _quality_sort_key,
+}
+
 @app.get("/", response_class=HTMLResponse)
 async def main_page(request: Request):
     """Main interactive jobs page with Alpine.js features"""
@@ -51,12 +76,12 @@ async def main_page(request: Request):
 async def simple_dashboard(request: Request, db: Session = Depends(get_db)):
     """Simple dashboard page (legacy)"""
     # Get recent jobs
-    recent_jobs = db.query(Job).order_by(Job.posted_at.desc()).limit(10).all()
+    recent_jobs = db.query(Job).options(defer(Job.raw_data)).order_by(Job.posted_at.desc()).limit(10).all()
     
     # Get stats
     total_jobs = db.query(Job).count()
     today_jobs = db.query(Job).filter(
-        Job.created_at >= datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        Job.created_at >= datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
     ).count()
     
     return templates.TemplateResponse("dashboard.html", {
@@ -80,7 +105,8 @@ async def get_jobs(
     db: Session = Depends(get_db)
 ):
     """Get jobs with filtering and pagination - includes all scraped sources"""
-    query = db.query(Job)
+    # raw_data is never rendered or returned by to_dict(); don't transfer it
+    query = db.query(Job).options(defer(Job.raw_data))
     
     # Apply source filter
     if source and source != "all":
@@ -148,26 +174,21 @@ async def get_jobs(
         "pages": (total + limit - 1) // limit
     }
 
-@app.get("/api/jobs/{job_id}")
-async def get_job(job_id: str, db: Session = Depends(get_db)):
-    """Get job details"""
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return job.to_dict()
-
+# Registered before /api/jobs/{job_id}, which would otherwise capture "stats" as a job id
 @app.get("/api/jobs/stats")
 async def get_job_stats(request: Request, db: Session = Depends(get_db)):
     """Get job statistics by source (HTMX-compatible)"""
-    total_jobs = db.query(Job).count()
+    # Per-source totals and last-7-days counts in one grouped pass (created_at is UTC)
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    source_stats = db.query(
+        Job.source,
+        func.count(Job.id),
+        func.count(case((Job.created_at >= week_ago, 1)))
+    ).group_by(Job.source).all()
     
-    # Count by source
-    source_stats = db.query(Job.source, func.count(Job.id)).group_by(Job.source).all()
-    source_counts = {source: count for source, count in source_stats}
-    
-    # Recent activity (last 7 days)
-    week_ago = datetime.now() - timedelta(days=7)
-    recent_jobs = db.query(Job).filter(Job.created_at >= week_ago).count()
+    source_counts = {source: count for source, count, _ in source_stats}
+    total_jobs = sum(source_counts.values())
+    recent_jobs = sum(recent for _, _, recent in source_stats)
     
     # Return HTMX template if requested from frontend
     if "HX-Request" in request.headers:
@@ -186,6 +207,14 @@ async def get_job_stats(request: Request, db: Session = Depends(get_db)):
         "available_sources": list(source_counts.keys())
     }
 
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, db: Session = Depends(get_db)):
+    """Get job details"""
+    job = db.query(Job).options(defer(Job.raw_data)).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
 @app.get("/htmx/jobs-table")
 async def htmx_jobs_table(
     request: Request,
@@ -211,26 +240,8 @@ async def htmx_jobs_table(
     
     # Apply client-side sorting if specified (database already handles basic ordering)
     if sort and sort != "posted_at":  # posted_at is already handled by database
-        def get_sort_key(job, sort_field):
-            if sort_field == "title":
-                return (job.get('title') or '').lower()
-            elif sort_field == "salary":
-                # Extract numeric value from salary string for sorting
-                salary = job.get('salary_range') or job.get('salary') or ''
-                import re
-                numbers = re.findall(r'[\d,]+', str(salary))
-                if numbers:
-                    try:
-                        return int(numbers[0].replace(',', ''))
-                    except:
-                        return 0
-                return 0
-            elif sort_field == "quality":
-                return job.get('quality_score', 0)
-            return (job.get('title') or '').lower()
-        
         reverse_sort = sort in ["salary", "quality"]  # These sort descending
-        all_jobs.sort(key=lambda job: get_sort_key(job, sort), reverse=reverse_sort)
+        all_jobs.sort(key=JOB_SORT_KEYS.get(sort, _title_sort_key), reverse=reverse_sort)
     
     return templates.TemplateResponse("partials/jobs_table.html", {
         "request": request,
@@ -243,7 +254,7 @@ async def htmx_jobs_table(
 @app.get("/htmx/job-card/{job_id}")
 async def htmx_job_card(request: Request, job_id: str, db: Session = Depends(get_db)):
     """HTMX endpoint for job card details"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.query(Job).options(defer(Job.raw_data)).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -256,12 +267,15 @@ async def htmx_job_card(request: Request, job_id: str, db: Session = Depends(get
 async def htmx_dashboard_stats(request: Request, db: Session = Depends(get_db)):
     """HTMX endpoint for dashboard statistics"""
     total_jobs = db.query(Job).count()
-    today_jobs = db.query(Job).filter(
-        Job.created_at >= datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    ).count()
-    week_jobs = db.query(Job).filter(
-        Job.created_at >= datetime.now() - timedelta(days=7)
-    ).count()
+    
+    # created_at is stored in UTC; compute both cutoffs once and count them in one pass
+    now = datetime.utcnow()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_ago = now - timedelta(days=7)
+    today_jobs, week_jobs = db.query(
+        func.count(case((Job.created_at >= today_start, 1))),
+        func.count(Job.id)
+    ).filter(Job.created_at >= week_ago).one()
     
     # Get latest scraping status
     latest_scrape = db.query(ScrapingJob).order_by(ScrapingJob.started_at.desc()).first()
@@ -10,7 +10,7 @@ from sqlalchemy import create_engine, text
 # Add the app directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 
-from app.database import engine, Base, DATABASE_URL
+from app.database import engine, Base, DATABASE_URL, SessionLocal, approx_count
 from app.models import Job, ScrapingJob
 
 # Set up logging
@@ -60,16 +60,18 @@ def migrate_database():
     logger.info("✅ Database migration completed successfully!")
 
 def restore_job_data(old_jobs):
-    """Restore job data with new schema"""
-    from app.database import SessionLocal
+    """Restore job data with new schema
     
-    restored_count = 0
+    Rows go in as plain dicts through one Core executemany INSERT, so no ORM Job
+    object, identity-map entry or per-row flush work is created for them.
+    """
+    rows = []
     
     with SessionLocal() as db:
         for old_job in old_jobs:
             try:
-                # Create job with old data, setting new fields to defaults
-                new_job = Job(
+                # Map the old columns onto the new schema, setting new fields to defaults
+                rows.append(dict(
                     id=old_job[0] if len(old_job) > 0 else None,
                     external_id=old_job[1] if len(old_job) > 1 else None,
                     title=old_job[2] if len(old_job) > 2 else "Unknown Title",
@@ -102,18 +104,17 @@ def restore_job_data(old_jobs):
                     scraped_at=old_job[18] if len(old_job) > 18 else None,
                     created_at=old_job[17] if len(old_job) > 17 else None,
                     updated_at=old_job[18] if len(old_job) > 18 else None
-                )
-                
-                db.add(new_job)
-                restored_count += 1
+                ))
                 
             except Exception as e:
                 logger.warning(f"Could not restore job {old_job[0] if old_job else 'unknown'}: {e}")
                 continue
         
         try:
+            if rows:
+                db.execute(Job.__table__.insert(), rows)
             db.commit()
-            logger.info(f"✅ Restored {restored_count} jobs with new schema")
+            logger.info(f"✅ Restored {len(rows)} jobs with new schema")
         except Exception as e:
             logger.error(f"Error committing restored jobs: {e}")
             db.rollback()
@@ -131,7 +132,7 @@ def verify_migration():
             'vessel_name', 'employment_type', 'position_level', 
             'salary_currency', 'salary_period', 'posted_date',
             'requirements', 'benefits', 'country', 'region',
-            'quality_score', 'raw_data', 'scraped_at'
+            'quality_score', 'raw_data', 'scraped_at', 'content_hash'
         ]
         
         missing_columns = [col for col in required_columns if col not in columns]
@@ -141,11 +142,23 @@ def verify_migration():
             return False
         else:
             logger.info("✅ All required columns present")
+        
+        # Lookup indexes (e.g. ix_jobs_source, ix_jobs_created_at_desc) are created with the tables
+        result = conn.execute(text("PRAGMA index_list(jobs)"))
+        indexes = {row[1] for row in result.fetchall()}
+        missing_indexes = sorted(index.name for index in Job.__table__.indexes if index.name not in indexes)
+        
+        if missing_indexes:
+            logger.error(f"❌ Migration incomplete. Missing indexes: {missing_indexes}")
+            return False
+        else:
+            logger.info("✅ All required indexes present")
             
-        # Check job count
-        result = conn.execute(text("SELECT COUNT(*) FROM jobs"))
-        job_count = result.fetchone()[0]
-        logger.info(f"Database now contains {job_count} jobs")
+        # Job count is informational only; skip the query when it won't be logged
+        if logger.isEnabledFor(logging.INFO):
+            with SessionLocal() as db:
+                job_count, is_estimate = approx_count(db, Job)
+            logger.info(f"Database now contains {'~' if is_estimate else ''}{job_count} jobs")
         
         return True
 
@@ -7,10 +7,18 @@ import logging
 from datetime import datetime
 import re
 import asyncio
+import hashlib
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import aiohttp
+from asyncio_throttle import Throttler
 import facebook
-from googlesearch import search
+from bs4 import BeautifulSoup
+from urllib.parse import urlparse, parse_qs
 import spacy
+from spacy.attrs import LEMMA
 from spacy.matcher import Matcher
 import uvicorn
 from contextlib import asynccontextmanager
@@ -23,6 +31,30 @@ logger = logging.getLogger(__name__)
 nlp = None
 job_matcher = None
 
+# Job detection helpers, built once instead of on every is_job_post call
+_SALARY_RE = re.compile(r'\$\d+(?:,\d+)*(?:\.\d+)?')
+_JOB_KEYWORDS = frozenset({
+    'hire', 'hiring', 'job', 'position', 'role', 'career', 'opportunity',
+    'apply', 'resume', 'cv', 'salary', 'wage', 'remote', 'fulltime', 'parttime',
+    'interview', 'candidate', 'employee', 'team', 'join', 'work', 'experience'
+})
+
+# Outbound web search
+GOOGLE_SEARCH_URL = "https://www.google.com/search"
+SEARCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+MAX_CONCURRENT_SEARCHES = 20
+NLP_BATCH_SIZE = 32
+CLASSIFY_CACHE_SIZE = 2048
+CLASSIFY_STATS_EVERY = 500    # log cache hit rate every N classified posts
+BLOCKING_SEARCH_WORKERS = 8
+HOST_RATE_LIMIT = 10          # requests per second, per target host
+SEARCH_MAX_ATTEMPTS = 5
+SEARCH_MAX_BACKOFF = 30       # seconds
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events for loading models on startup"""
@@ -30,16 +62,27 @@ async def lifespan(app: FastAPI):
     
     # Load spaCy model on startup
     try:
-        nlp = spacy.load("en_core_web_sm")
+        # Job detection only needs tokens and lemmas; the rule lemmatizer relies on
+        # tagger + attribute_ruler, so only the parser, NER and senter are left out.
+        # exclude= (unlike disable=) skips loading their weights at all.
+        nlp = spacy.load("en_core_web_sm", exclude=["parser", "ner", "senter"])
         job_matcher = Matcher(nlp.vocab)
         logger.info("spaCy model loaded successfully")
+        # The bot is created at import time, before the model exists
+        bot.setup_job_patterns()
     except OSError:
         logger.warning("spaCy model not found. Job detection will be limited.")
         nlp = None
     
+    # One pooled HTTP session for all outbound searches
+    await bot.start()
+    app.state.http = bot.session
+    app.state.search_pool = bot.search_pool
+    
     yield
     
-    # Cleanup (if needed)
+    # Cleanup
+    await bot.close()
     logger.info("Shutting down...")
 
 app = FastAPI(
@@ -69,13 +112,55 @@ class FacebookSearchRequest(BaseModel):
 
 class SearchBot:
     def __init__(self):
+        self._kw_hashes = frozenset()
+        # Reposts and templated recruiter posts repeat verbatim; memoize by content hash
+        self._classify_cache: "OrderedDict[bytes, bool]" = OrderedDict()
+        self._classify_lock = threading.Lock()
+        self._classify_lookups = 0
+        self._classify_hits = 0
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.search_pool: Optional[ThreadPoolExecutor] = None
+        self._search_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+        self._host_throttlers: Dict[str, Throttler] = {}
         self.setup_job_patterns()
     
+    async def start(self):
+        """Open the shared HTTP session and thread pool used for outbound searches"""
+        if self.search_pool is None:
+            # Dedicated pool so blocking API calls can't starve the default executor
+            self.search_pool = ThreadPoolExecutor(
+                max_workers=BLOCKING_SEARCH_WORKERS,
+                thread_name_prefix="search"
+            )
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=15),
+                headers=SEARCH_HEADERS
+            )
+    
+    async def close(self):
+        """Close the shared HTTP session and thread pool"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        if self.search_pool is not None:
+            self.search_pool.shutdown(wait=False, cancel_futures=True)
+            self.search_pool = None
+    
     def setup_job_patterns(self):
         """Setup spaCy patterns for job detection"""
-        if not nlp or not job_matcher:
+        if nlp is None or job_matcher is None:
             return
         
+        # Lemma hashes for the keywords, so counting never materializes token strings.
+        # Capitalized variants cover lemmas that keep their case (e.g. proper nouns).
+        self._kw_hashes = frozenset(
+            nlp.vocab.strings.add(variant)
+            for keyword in _JOB_KEYWORDS
+            for variant in (keyword, keyword.capitalize(), keyword.upper())
+        )
+        
         hiring_patterns = [
             [{"LOWER": {"IN": ["hiring", "recruiting", "seeking"]}}],
             [{"LOWER": {"IN": ["job", "position", "role"]}}, 
@@ -97,57 +182,164 @@ class SearchBot:
     
     def is_job_post(self, text: str) -> bool:
         """Check if text is a job post using spaCy"""
-        if not nlp or not job_matcher or not text:
+        if nlp is None or job_matcher is None or not text:
             return False
         
         try:
-            doc = nlp(text)
-            matches = job_matcher(doc)
-            
-            job_keywords = {
-                'hire', 'hiring', 'job', 'position', 'role', 'career', 'opportunity',
-                'apply', 'resume', 'cv', 'salary', 'wage', 'remote', 'fulltime', 'parttime',
-                'interview', 'candidate', 'employee', 'team', 'join', 'work', 'experience'
-            }
-            
-            keyword_count = sum(1 for token in doc if token.lemma_.lower() in job_keywords)
-            
-            # Additional pattern checks
-            salary_pattern = r'\$\d+(?:,\d+)*(?:\.\d+)?'
-            has_salary = bool(re.search(salary_pattern, text))
-            
-            return len(matches) > 0 or keyword_count >= 2 or has_salary
-            
+            return self.is_job_post_doc(nlp(text), text)
         except Exception as e:
             logger.error(f"Error in job detection: {str(e)}")
             return False
     
+    def is_job_post_doc(self, doc, text: str) -> bool:
+        """Classify an already-processed spaCy Doc as a job post"""
+        # Cheapest signals first; stop as soon as one of them fires
+        if _SALARY_RE.search(text):
+            return True
+        
+        if job_matcher(doc):
+            return True
+        
+        # Compare interned lemma IDs (ints) against the keyword hash set
+        keyword_count = 0
+        for lemma, count in doc.count_by(LEMMA).items():
+            if lemma in self._kw_hashes:
+                keyword_count += count
+                if keyword_count >= 2:
+                    return True
+        return False
+    
+    def classify_job_posts(self, texts: List[str]) -> List[bool]:
+        """Classify many texts with one batched nlp.pipe call
+        
+        Results are cached by a 64-bit blake2b hash of the text, and only distinct
+        uncached texts are sent through the pipeline.
+        """
+        if nlp is None or job_matcher is None:
+            return [False] * len(texts)
+        
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest() for text in texts]
+        results: Dict[bytes, bool] = {}
+        with self._classify_lock:
+            for key in keys:
+                if key in self._classify_cache:
+                    self._classify_cache.move_to_end(key)
+                    results[key] = self._classify_cache[key]
+        hits = sum(1 for key in keys if key in results)
+        
+        pending: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in results:
+                pending.setdefault(key, text)
+        
+        if pending:
+            try:
+                docs = nlp.pipe(pending.values(), batch_size=NLP_BATCH_SIZE)
+                for (key, text), doc in zip(pending.items(), docs):
+                    results[key] = self.is_job_post_doc(doc, text)
+            except Exception as e:
+                logger.error(f"Error in job detection: {str(e)}")
+                return [False] * len(texts)
+            
+            with self._classify_lock:
+                for key in pending:
+                    self._classify_cache[key] = results[key]
+                while len(self._classify_cache) > CLASSIFY_CACHE_SIZE:
+                    self._classify_cache.popitem(last=False)
+        
+        self._record_classify_stats(len(keys), hits)
+        return [results[key] for key in keys]
+    
+    def _record_classify_stats(self, lookups: int, hits: int):
+        """Periodically log the classification cache hit rate"""
+        with self._classify_lock:
+            before = self._classify_lookups // CLASSIFY_STATS_EVERY
+            self._classify_lookups += lookups
+            self._classify_hits += hits
+            if self._classify_lookups // CLASSIFY_STATS_EVERY > before:
+                logger.info(
+                    f"Job classification cache: {self._classify_hits}/{self._classify_lookups} hits "
+                    f"({self._classify_hits / self._classify_lookups:.0%})"
+                )
+    
     async def search_web(self, query: str, max_results: int = 5) -> List[str]:
         """Perform web search and return results"""
         try:
-            # Using Google Search in a separate thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            search_results = await loop.run_in_executor(
-                None, 
-                lambda: list(search(query, num_results=max_results))
-            )
-            return search_results
+            return await self._google_search(query, max_results)
         except Exception as e:
             logger.error(f"Search error: {str(e)}")
             return []
     
+    async def _google_search(self, query: str, max_results: int) -> List[str]:
+        """Fetch a Google results page over the shared session and extract result URLs"""
+        if self.session is None or self.session.closed:
+            await self.start()
+        
+        params = {'q': query, 'num': max_results + 2, 'hl': 'en'}
+        html = await self._fetch_text(GOOGLE_SEARCH_URL, params)
+        return self._parse_search_results(html, max_results)
+    
+    async def _fetch_text(self, url: str, params: Dict[str, Any]) -> str:
+        """GET a page with per-host rate limiting and jittered exponential backoff
+        
+        Retries on 429/5xx up to SEARCH_MAX_ATTEMPTS times, honouring Retry-After.
+        """
+        host = urlparse(url).netloc
+        throttler = self._host_throttlers.get(host)
+        if throttler is None:
+            throttler = self._host_throttlers[host] = Throttler(rate_limit=HOST_RATE_LIMIT, period=1.0)
+        
+        for attempt in range(SEARCH_MAX_ATTEMPTS):
+            async with self._search_semaphore, throttler:
+                async with self.session.get(url, params=params) as response:
+                    if response.status not in RETRYABLE_STATUSES or attempt == SEARCH_MAX_ATTEMPTS - 1:
+                        response.raise_for_status()
+                        return await response.text()
+                    delay = self._retry_delay(response.headers.get('Retry-After'), attempt)
+            
+            logger.warning(f"{host} returned {response.status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait before the next attempt"""
+        if retry_after and retry_after.isdigit():
+            return min(SEARCH_MAX_BACKOFF, int(retry_after))
+        return min(SEARCH_MAX_BACKOFF, 2 ** attempt) + random.random()
+    
+    @staticmethod
+    def _parse_search_results(html: str, max_results: int) -> List[str]:
+        """Extract outbound result links from a Google results page"""
+        soup = BeautifulSoup(html, 'lxml')
+        results = []
+        seen = set()
+        
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if href.startswith('/url?'):
+                # Redirect links on the non-JS results page: /url?q=<target>&...
+                href = parse_qs(urlparse(href).query).get('q', [''])[0]
+            
+            parsed = urlparse(href)
+            if parsed.scheme not in ('http', 'https') or 'google.' in parsed.netloc:
+                continue
+            if href in seen:
+                continue
+            
+            seen.add(href)
+            results.append(href)
+            if len(results) >= max_results:
+                break
+        
+        return results
+    
     async def search_jobs(self, location: str = "remote", max_results: int = 5) -> List[str]:
         """Search for job postings"""
         try:
             # Search for jobs using web search
             job_query = f"jobs hiring {location} site:indeed.com OR site:linkedin.com OR site:glassdoor.com"
             
-            loop = asyncio.get_event_loop()
-            job_results = await loop.run_in_executor(
-                None, 
-                lambda: list(search(job_query, num_results=max_results))
-            )
-            return job_results
+            return await self._google_search(job_query, max_results)
         except Exception as e:
             logger.error(f"Jobs search error: {str(e)}")
             return []
@@ -155,10 +347,12 @@ class SearchBot:
     async def search_facebook(self, search_term: str, max_results: int = 10) -> Dict[str, Any]:
         """Search Facebook group posts"""
         try:
-            # Run Facebook API call in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            # Run Facebook API call in the search pool to avoid blocking
+            if self.search_pool is None:
+                await self.start()
+            loop = asyncio.get_running_loop()
             posts_data = await loop.run_in_executor(
-                None, 
+                self.search_pool, 
                 self._search_facebook_posts, 
                 search_term
             )
@@ -176,19 +370,25 @@ class SearchBot:
             job_posts = []
             regular_posts = []
             
-            for post in feed['data']:
-                if 'message' in post and search_term.lower() in post['message'].lower():
-                    post_data = {
-                        'id': post['id'],
-                        'message': post['message'][:150] + "..." if len(post['message']) > 150 else post['message'],
-                        'created_time': post.get('created_time', 'Unknown')[:10],  # Just date
-                        'author': post.get('from', {}).get('name', 'Unknown')
-                    }
-                    
-                    if self.is_job_post(post['message']):
-                        job_posts.append(post_data)
-                    else:
-                        regular_posts.append(post_data)
+            term = search_term.lower()
+            matching_posts = [
+                post for post in feed['data']
+                if 'message' in post and term in post['message'].lower()
+            ]
+            job_flags = self.classify_job_posts([post['message'] for post in matching_posts])
+            
+            for post, is_job in zip(matching_posts, job_flags):
+                post_data = {
+                    'id': post['id'],
+                    'message': post['message'][:150] + "..." if len(post['message']) > 150 else post['message'],
+                    'created_time': post.get('created_time', 'Unknown')[:10],  # Just date
+                    'author': post.get('from', {}).get('name', 'Unknown')
+                }
+                
+                if is_job:
+                    job_posts.append(post_data)
+                else:
+                    regular_posts.append(post_data)
             
             return {"job_posts": job_posts, "regular_posts": regular_posts}
             
@@ -202,12 +402,7 @@ class SearchBot:
             # Search for news
             news_query = f"{topic} news today site:reuters.com OR site:bbc.com OR site:cnn.com OR site:techcrunch.com"
             
-            loop = asyncio.get_event_loop()
-            news_results = await loop.run_in_executor(
-                None, 
-                lambda: list(search(news_query, num_results=max_results))
-            )
-            return news_results
+            return await self._google_search(news_query, max_results)
         except Exception as e:
             logger.error(f"News search error: {str(e)}")
             return []
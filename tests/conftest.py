@@ -0,0 +1,31 @@
+"""Shared fixtures for the test suite"""
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Make the app package importable when pytest is run as plain `pytest` from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.scrapers.base import UniversalJob
+
+
+@pytest.fixture
+def make_job():
+    """Factory for valid UniversalJob objects; keyword arguments override the defaults"""
+    def make(external_id="123", **overrides):
+        data = dict(
+            external_id=external_id,
+            title="Deckhand wanted",
+            company="Yotspot",
+            source="yotspot",
+            source_url=f"https://www.yotspot.com/jobs/{external_id}",
+            location="Miami",
+            description="Deckhand for a 50m motor yacht",
+            posted_date=datetime(2025, 8, 15),
+        )
+        data.update(overrides)
+        return UniversalJob(**data)
+
+    return make
@@ -0,0 +1,83 @@
+"""SQL generated by the PostgreSQL COPY upsert path, checked against a fake session"""
+import csv
+import io
+
+from app.scrapers.base import _copy_upsert
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+
+    def copy_expert(self, sql, buffer):
+        self.db.copy_sql = sql
+        self.db.copy_rows = list(csv.reader(io.StringIO(buffer.read())))
+
+    def close(self):
+        pass
+
+
+class FakeResult:
+    def all(self):
+        return []
+
+
+class FakeSession:
+    """Records what _copy_upsert sends instead of talking to PostgreSQL"""
+
+    def __init__(self):
+        self.statements = []
+        self.copy_sql = None
+        self.copy_rows = None
+
+    def execute(self, statement, *args):
+        self.statements.append(str(statement))
+        return FakeResult()
+
+    def connection(self):
+        session = self
+
+        class Connection:
+            @property
+            def connection(self):
+                return type("DBAPIConnection", (), {"cursor": lambda _: FakeCursor(session)})()
+
+        return Connection()
+
+
+def test_copy_upsert_sends_python_side_defaults(make_job):
+    db = FakeSession()
+    _copy_upsert(db, [make_job().to_row_dict()])
+
+    columns = db.copy_sql.split("(", 1)[1].split(")", 1)[0].split(", ")
+    assert columns[0] == "id"
+    assert "is_featured" in columns
+    assert "created_at" not in columns  # set in UTC by the INSERT ... SELECT
+
+    [row] = db.copy_rows
+    assert len(row) == len(columns)
+    assert row[columns.index("is_featured")] == "False"
+    assert row[columns.index("salary_range")] == "\\N"
+    assert row[columns.index("requirements")] == "[]"
+
+
+def test_copy_upsert_insert_select_statement(make_job):
+    db = FakeSession()
+    _copy_upsert(db, [make_job("1").to_row_dict(), make_job("2").to_row_dict()])
+
+    create, insert = db.statements
+    assert create.startswith("CREATE TEMP TABLE jobs_stage")
+    assert "NULL '\\N'" in db.copy_sql
+    assert len(db.copy_rows) == 2
+
+    column_list = db.copy_sql.split("(", 1)[1].split(")", 1)[0]
+    assert insert.startswith(f"INSERT INTO jobs ({column_list}, created_at, updated_at) ")
+    assert (
+        f"SELECT {column_list}, timezone('utc', now()), timezone('utc', now()) FROM jobs_stage"
+        in insert
+    )
+    assert "ON CONFLICT (external_id) DO UPDATE SET" in insert
+    assert "content_hash = EXCLUDED.content_hash" in insert
+    assert "is_featured = EXCLUDED" not in insert  # creation-time flag isn't overwritten
+    assert "WHERE jobs.content_hash IS DISTINCT FROM EXCLUDED.content_hash" in insert
+    assert insert.endswith("RETURNING external_id, scraped_at")
@@ -0,0 +1,44 @@
+"""ScrapingService.scrape_source result counts"""
+import asyncio
+
+from app.scrapers.base import BaseScraper
+from app.services.scraping_service import ScrapingService
+
+
+class FailingScraper(BaseScraper):
+    """Yields the given jobs, then fails like a scrape that loses its connection"""
+    source_name = "yotspot"
+    base_url = "https://www.yotspot.com"
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.saved = []
+
+    async def scrape_jobs(self, max_pages=5, filters=None):
+        for job in self.jobs:
+            yield job
+        raise ConnectionError("connection reset")
+
+    async def upsert_jobs(self, jobs):
+        self.saved.extend(jobs)
+        return len(jobs), 0
+
+    async def test_connection(self):
+        return True
+
+    def get_supported_filters(self):
+        return []
+
+
+def test_scrape_source_reports_jobs_saved_before_a_failure(make_job, monkeypatch):
+    scraper = FailingScraper([make_job("1"), make_job("2")])
+    service = ScrapingService()
+    monkeypatch.setattr(service.registry, "get_scraper", lambda name: scraper)
+
+    result = asyncio.run(service.scrape_source("yotspot"))
+
+    assert len(scraper.saved) == 2
+    assert result["jobs_found"] == 2
+    assert result["new_jobs"] == 2
+    assert result["updated_jobs"] == 0
+    assert result["errors"] == ["connection reset"]
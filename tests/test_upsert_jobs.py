@@ -0,0 +1,104 @@
+"""BaseScraper.upsert_jobs and JobBatcher against a throwaway SQLite database"""
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Job
+from app.scrapers import base
+from app.scrapers.base import BaseScraper, JobBatcher
+
+
+class DummyScraper(BaseScraper):
+    source_name = "yotspot"
+    base_url = "https://www.yotspot.com"
+
+    async def scrape_jobs(self, max_pages=5, filters=None):
+        return
+        yield
+
+    async def test_connection(self):
+        return True
+
+    def get_supported_filters(self):
+        return []
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(base, "SessionLocal", factory)
+    monkeypatch.setattr(base, "init_db", lambda: None)
+    yield factory
+    engine.dispose()
+
+
+def test_upsert_counts_inserts_updates_and_skips_unchanged(session_factory, make_job):
+    scraper = DummyScraper()
+
+    assert asyncio.run(scraper.upsert_jobs([make_job("1"), make_job("2")])) == (2, 0)
+    # Same content scraped again: the content_hash guard leaves both rows alone
+    assert asyncio.run(scraper.upsert_jobs([make_job("1"), make_job("2")])) == (0, 0)
+    assert asyncio.run(
+        scraper.upsert_jobs([make_job("1", title="Bosun wanted"), make_job("3")])
+    ) == (1, 1)
+
+    with session_factory() as db:
+        titles = dict(db.query(Job.external_id, Job.title).all())
+    assert titles == {"1": "Bosun wanted", "2": "Deckhand wanted", "3": "Deckhand wanted"}
+
+
+def test_upsert_keeps_the_last_duplicate_in_a_batch(session_factory, make_job):
+    scraper = DummyScraper()
+
+    assert asyncio.run(
+        scraper.upsert_jobs([make_job("1"), make_job("1", title="Chief stew wanted")])
+    ) == (1, 0)
+
+    with session_factory() as db:
+        assert db.query(Job.title).filter(Job.external_id == "1").scalar() == "Chief stew wanted"
+
+
+def test_job_batcher_saves_full_batches_and_the_remainder_on_flush(make_job):
+    saved_batches = []
+
+    async def save(batch):
+        saved_batches.append([job.external_id for job in batch])
+        return len(batch)
+
+    async def run():
+        batcher = JobBatcher(save, max_batch_size=2, max_queue_time=60)
+        for external_id in "12345":
+            await batcher.add(make_job(external_id))
+        return await batcher.flush()
+
+    assert asyncio.run(run()) == 5
+    assert saved_batches == [["1", "2"], ["3", "4"], ["5"]]
+
+
+def test_job_batcher_hands_off_a_batch_once_it_is_old_enough(make_job):
+    saved_batches = []
+
+    async def save(batch):
+        saved_batches.append(len(batch))
+        return len(batch)
+
+    async def run():
+        batcher = JobBatcher(save, max_batch_size=100, max_queue_time=0)
+        await batcher.add(make_job("1"))
+        await batcher.add(make_job("2"))
+        return await batcher.flush()
+
+    assert asyncio.run(run()) == 2
+    assert saved_batches == [1, 1]
+
+
+def test_job_batcher_flush_with_nothing_buffered():
+    async def save(batch):
+        raise AssertionError("nothing to save")
+
+    assert asyncio.run(JobBatcher(save).flush()) == 0